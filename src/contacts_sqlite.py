@@ -0,0 +1,83 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Direct reads of the macOS Contacts store.
+
+Contacts.app keeps each account in an AddressBook SQLite database. Reading
+those read-only avoids launching Contacts.app and its per-property Apple
+events. Like chat.db, this needs Full Disk Access.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import glob
+import os
+import sqlite3
+
+
+_RECORDS_QUERY = """
+    SELECT Z_PK, ZFIRSTNAME, ZMIDDLENAME, ZLASTNAME, ZORGANIZATION
+    FROM ZABCDRECORD
+    WHERE COALESCE(ZFIRSTNAME, ZMIDDLENAME, ZLASTNAME, ZORGANIZATION) IS NOT NULL
+"""
+_PHONES_QUERY = """
+    SELECT ZOWNER, ZFULLNUMBER FROM ZABCDPHONENUMBER
+    WHERE ZFULLNUMBER IS NOT NULL
+    ORDER BY ZOWNER, ZORDERINGINDEX
+"""
+_EMAILS_QUERY = """
+    SELECT ZOWNER, ZADDRESS FROM ZABCDEMAILADDRESS
+    WHERE ZADDRESS IS NOT NULL
+    ORDER BY ZOWNER, ZORDERINGINDEX
+"""
+
+
+def get_address_book_paths() -> list[str]:
+    """Get the AddressBook databases for the local store and every synced account."""
+    root = os.path.expanduser("~/Library/Application Support/AddressBook")
+    paths = glob.glob(os.path.join(root, "AddressBook-v22.abcddb"))
+    paths += sorted(glob.glob(os.path.join(root, "Sources", "*", "AddressBook-v22.abcddb")))
+    return paths
+
+
+def _read_address_book(path: str) -> list[dict]:
+    """Read every named contact from one AddressBook database."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        phones: dict[int, list[str]] = {}
+        for owner, number in conn.execute(_PHONES_QUERY):
+            phones.setdefault(owner, []).append(number)
+        emails: dict[int, list[str]] = {}
+        for owner, address in conn.execute(_EMAILS_QUERY):
+            emails.setdefault(owner, []).append(address)
+
+        contacts = []
+        for pk, first, middle, last, organization in conn.execute(_RECORDS_QUERY):
+            # Match Contacts.app's display name: the person's name, else the company
+            name = " ".join(part for part in (first, middle, last) if part) or organization
+            if name:
+                contacts.append({"name": name, "phones": phones.get(pk, []), "emails": emails.get(pk, [])})
+        return contacts
+    finally:
+        conn.close()
+
+
+def load_contacts(paths: list[str] | None = None) -> list[dict] | None:
+    """Load every contact from the AddressBook databases.
+
+    Args:
+        paths: Databases to read; defaults to get_address_book_paths()
+
+    Returns:
+        Contacts with name, phones and emails, or None if no database could
+        be read (e.g. no Full Disk Access or a schema this code doesn't know)
+
+    """
+    contacts = []
+    readable = False
+    for path in get_address_book_paths() if paths is None else paths:
+        with contextlib.suppress(sqlite3.Error):
+            contacts += _read_address_book(path)
+            readable = True
+    return contacts if readable else None
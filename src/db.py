@@ -9,15 +9,172 @@ Requires Full Disk Access permission on macOS.
 
 from __future__ import annotations
 
+import hashlib
+import itertools
+import json
 import os
+import queue
 import shutil
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from datetime import datetime
-from pathlib import Path
+
+from search_index import MessageSearchIndex, to_fts_query
+from snapshot import IndexedSnapshot
 
 
 # macOS epoch starts 2001-01-01, timestamps are in nanoseconds
 MAC_EPOCH = datetime(2001, 1, 1).timestamp()
+MAC_EPOCH_NS = int(MAC_EPOCH) * 1_000_000_000
+
+# 2001-01-01T00:00:00Z in Unix nanoseconds, for timestamps that are exact UTC rather than local-epoch based
+UNIX_MAC_EPOCH_NS = 978_307_200 * 1_000_000_000
+
+# Reaction types: 2000-2005 = add reaction, 3000-3005 = remove reaction
+_REACTION_NAMES = ("love", "like", "dislike", "laugh", "emphasize", "question")
+
+
+def _reaction_info(associated_type: int) -> tuple[bool, str | None, bool]:
+    """Get (is_reaction, reaction_type, is_reaction_removal) for an associated_message_type."""
+    if associated_type < 2000:
+        return (False, None, False)
+    offset = associated_type % 1000
+    reaction_type = _REACTION_NAMES[offset] if offset < len(_REACTION_NAMES) else None
+    return (True, reaction_type, associated_type >= 3000)
+
+
+# Precomputed for plain messages and the standard reaction codes
+_REACTION_TABLE = {t: _reaction_info(t) for t in (0, *range(2000, 2006), *range(3000, 3006))}
+
+
+# Read-side tuning applied to every connection. journal_mode/synchronous are
+# left alone: chat.db is a WAL database owned by Messages.app and a read-only
+# connection cannot change its journal mode. The mmap window is address space
+# shared through the OS page cache, so it can cover a multi-GB chat.db; pages
+# read through it skip SQLite's own cache, which stays per-connection sized.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA mmap_size = 1073741824",  # 1 GiB
+    "PRAGMA cache_size = -65536",  # 64 MiB
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Upper bound on pooled chat.db connections
+_MAX_POOL_SIZE = 4
+
+# Rows pulled from sqlite per fetchmany call when streaming results
+_FETCH_BATCH_SIZE = 512
+
+# Columns shared by every message query; filters are appended per call shape
+_MESSAGE_COLUMNS = """
+    SELECT
+        m.rowid as id,
+        m.guid,
+        m.text,
+        m.date as timestamp,
+        m.is_from_me,
+        m.is_read,
+        m.is_sent,
+        m.is_delivered,
+        m.cache_has_attachments as has_attachments,
+        m.associated_message_guid,
+        m.associated_message_type,
+        h.id as sender,
+        c.chat_identifier,
+        c.display_name as chat_name,
+        c.group_id
+"""
+
+# One row per message: a message can sit in several chats (e.g. an SMS and an
+# iMessage thread for the same handle), so take the first chat rather than
+# joining every chat_message_join row and sorting the duplicates.
+_MESSAGE_SELECT = _MESSAGE_COLUMNS + """
+    FROM message m
+    LEFT JOIN handle h ON m.handle_id = h.rowid
+    LEFT JOIN chat c ON c.rowid = (
+        SELECT cmj.chat_id FROM chat_message_join cmj WHERE cmj.message_id = m.rowid LIMIT 1
+    )
+"""
+
+# With a chat_id filter, start from the matching chat so only its messages are
+# joined and sorted. The chat_id param binds first, ahead of the WHERE params.
+_CHAT_MESSAGE_SELECT = _MESSAGE_COLUMNS + """
+    FROM chat c
+    JOIN chat_message_join cmj ON cmj.chat_id = c.rowid
+    JOIN message m ON m.rowid = cmj.message_id
+    LEFT JOIN handle h ON m.handle_id = h.rowid
+    WHERE c.chat_identifier = ?
+"""
+
+
+def _build_message_queries() -> dict[tuple[bool, bool, str | None, bool], str]:
+    """Build the get_messages SQL for every filter combination.
+
+    Params are bound in the same order the filters are appended here:
+    chat_id, since, search, then limit.
+    """
+    queries = {}
+    for has_chat, has_since, search_mode, unread_only in itertools.product(
+        (False, True), (False, True), (None, "fts", "like"), (False, True)
+    ):
+        query = _CHAT_MESSAGE_SELECT if has_chat else _MESSAGE_SELECT + " WHERE 1=1"
+        if has_since:
+            query += " AND m.date > ?"
+        if search_mode == "fts":
+            query += " AND m.rowid IN (SELECT rowid FROM fts.message_fts WHERE message_fts MATCH ?)"
+        elif search_mode == "like":
+            query += " AND m.text LIKE ?"
+        if unread_only:
+            query += " AND m.is_read = 0 AND m.is_from_me = 0"
+        # Always fetch in DESC order, then reverse if chronological
+        query += " ORDER BY m.date DESC LIMIT ?"
+        queries[has_chat, has_since, search_mode, unread_only] = query
+    return queries
+
+
+# Keyed by (has chat_id, has since, search mode, unread_only). Fixed text per
+# shape also lets sqlite3's statement cache reuse each prepared statement.
+_MESSAGE_QUERIES = _build_message_queries()
+
+# sqlite3's per-connection statement cache must hold every shape as plain,
+# JSON and chronological JSON text plus the fixed queries below; never go
+# below sqlite3's default of 128
+_CACHED_STATEMENTS = max(128, 3 * len(_MESSAGE_QUERIES) + 16)
+
+# json_object() over _MESSAGE_COLUMNS, mirroring _rows_to_messages
+_MESSAGE_JSON_OBJECT = """
+    json_group_array(json_object(
+        'id', id,
+        'guid', guid,
+        'text', text,
+        'timestamp_ns', timestamp + {epoch_ns},
+        'is_from_me', json(CASE WHEN is_from_me THEN 'true' ELSE 'false' END),
+        'is_read', json(CASE WHEN is_read THEN 'true' ELSE 'false' END),
+        'is_sent', json(CASE WHEN is_sent THEN 'true' ELSE 'false' END),
+        'is_delivered', json(CASE WHEN is_delivered THEN 'true' ELSE 'false' END),
+        'has_attachments', json(CASE WHEN has_attachments THEN 'true' ELSE 'false' END),
+        'sender', sender,
+        'chat_identifier', chat_identifier,
+        'chat_name', chat_name,
+        'is_group', json(CASE WHEN COALESCE(group_id, '') != '' THEN 'true' ELSE 'false' END),
+        'is_reaction', json(CASE WHEN associated_message_type >= 2000 THEN 'true' ELSE 'false' END),
+        'reaction_type', CASE WHEN associated_message_type >= 2000 THEN CASE associated_message_type % 1000
+            {reaction_cases}
+        END END,
+        'is_reaction_removal', json(CASE WHEN associated_message_type >= 3000 THEN 'true' ELSE 'false' END),
+        'associated_message_guid', associated_message_guid
+    ))
+""".format(
+    epoch_ns=UNIX_MAC_EPOCH_NS,
+    reaction_cases=" ".join(f"WHEN {i} THEN '{name}'" for i, name in enumerate(_REACTION_NAMES)),
+)
+
+# Watcher polling queries, kept as fixed text so each poll reuses the prepared statement
+_MESSAGES_SINCE_ID_QUERY = _MESSAGE_SELECT + " WHERE m.rowid > ? ORDER BY m.rowid ASC LIMIT ?"
+_LATEST_MESSAGE_ID_QUERY = "SELECT MAX(rowid) FROM message"
+_RECENT_MESSAGES_QUERY = _MESSAGE_SELECT + " ORDER BY m.rowid DESC LIMIT ?"
 
 
 def get_db_path() -> str:
@@ -25,6 +182,22 @@ def get_db_path() -> str:
     return os.path.expanduser("~/Library/Messages/chat.db")
 
 
+def get_cache_dir() -> str:
+    """Get the directory for sidecar files derived from chat.db."""
+    return os.path.expanduser("~/Library/Caches/imessage-mcp")
+
+
+def get_sidecar_path(db_path: str, name: str) -> str:
+    """Get the cache path for a sidecar file of one chat.db.
+
+    Named after the database's resolved path, so different chat.db files
+    never share a sidecar.
+    """
+    digest = hashlib.sha256(os.path.realpath(db_path).encode()).hexdigest()[:16]
+    stem, ext = os.path.splitext(name)
+    return os.path.join(get_cache_dir(), f"{stem}-{digest}{ext}")
+
+
 def download_attachment(source_path: str, dest_path: str, convert_to_jpeg: bool = True) -> dict:
     """Copy an attachment file to a destination path, converting images if needed.
 
@@ -86,47 +259,272 @@ def mac_timestamp_to_iso(ns_timestamp: int | None) -> str | None:
     """Convert macOS nanosecond timestamp to ISO string."""
     if ns_timestamp is None:
         return None
-    seconds = ns_timestamp / 1_000_000_000
-    unix_timestamp = seconds + MAC_EPOCH
-    return datetime.fromtimestamp(unix_timestamp).isoformat()
+    seconds, nanoseconds = divmod(ns_timestamp + MAC_EPOCH_NS, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+
+def _rows_to_messages(rows: list[tuple]) -> list[dict]:
+    """Convert a batch of _MESSAGE_COLUMNS rows to message dicts with reaction info.
+
+    Runs as one loop per batch with lookups bound to locals, rather than a
+    method call per row.
+    """
+    to_iso = mac_timestamp_to_iso
+    reaction_table = _REACTION_TABLE
+    messages: list[dict] = []
+    append = messages.append
+    for (
+        message_id,
+        guid,
+        text,
+        date,
+        is_from_me,
+        is_read,
+        is_sent,
+        is_delivered,
+        has_attachments,
+        associated_message_guid,
+        associated_type,
+        sender,
+        chat_identifier,
+        chat_name,
+        group_id,
+    ) in rows:
+        is_reaction, reaction_type, is_reaction_removal = reaction_table.get(associated_type) or _reaction_info(
+            associated_type or 0
+        )
+        append(
+            {
+                "id": message_id,
+                "guid": guid,
+                "text": text,
+                "timestamp": to_iso(date),
+                "is_from_me": bool(is_from_me),
+                "is_read": bool(is_read),
+                "is_sent": bool(is_sent),
+                "is_delivered": bool(is_delivered),
+                "has_attachments": bool(has_attachments),
+                "sender": sender,
+                "chat_identifier": chat_identifier,
+                "chat_name": chat_name,
+                "is_group": bool(group_id),
+                "is_reaction": is_reaction,
+                "reaction_type": reaction_type,
+                "is_reaction_removal": is_reaction_removal,
+                "associated_message_guid": associated_message_guid,
+            }
+        )
+    return messages
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """Fetch the remaining rows of a cursor as dicts keyed by column name.
+
+    For queries whose columns map straight onto the returned keys (aliased in
+    the SQL), so each row is built by dict(zip()) in C rather than a literal.
+    """
+    columns = tuple(description[0] for description in cursor.description)
+    return [dict(zip(columns, row, strict=True)) for row in cursor]
 
 
 class IMessageDatabase:
     """Read-only access to the iMessage SQLite database."""
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        search_index_path: str | None = None,
+        indexed_snapshot: bool | None = None,
+    ) -> None:
         """Initialize database connection.
 
         Args:
             db_path: Path to chat.db, defaults to ~/Library/Messages/chat.db
+            search_index_path: Path to the full-text search sidecar, defaults to
+                ~/Library/Caches/imessage-mcp/search-<hash of db_path>.db
+            indexed_snapshot: Query an indexed copy of chat.db instead of the
+                original, defaults to the IMESSAGE_MCP_INDEXED_SNAPSHOT env var
+
+        Raises:
+            FileNotFoundError: If chat.db doesn't exist or isn't readable
 
         """
         self.db_path = db_path or get_db_path()
-        self._conn: sqlite3.Connection | None = None
-
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get or create a database connection."""
-        if self._conn is None:
-            if not Path(self.db_path).exists():
-                msg = (
-                    f"iMessage database not found at {self.db_path}. "
-                    "Make sure you're on macOS and have Full Disk Access enabled."
-                )
-                raise FileNotFoundError(msg)
-            # Open in read-only mode with URI
-            self._conn = sqlite3.connect(
-                f"file:{self.db_path}?mode=ro",
-                uri=True,
-                check_same_thread=False,
+        # The path is fixed, so check it once here rather than on every connect
+        try:
+            os.stat(self.db_path)
+        except OSError as e:
+            msg = (
+                f"iMessage database not found at {self.db_path}. "
+                "Make sure you're on macOS and have Full Disk Access enabled."
             )
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
+            raise FileNotFoundError(msg) from e
+        if indexed_snapshot is None:
+            indexed_snapshot = os.getenv("IMESSAGE_MCP_INDEXED_SNAPSHOT", "") not in ("", "0", "false")
+        self._snapshot: IndexedSnapshot | None = (
+            IndexedSnapshot(self.db_path, get_sidecar_path(self.db_path, "chat.db")) if indexed_snapshot else None
+        )
+        # Each slot holds (generation, connection), or None until first opened
+        pool_size = min(_MAX_POOL_SIZE, os.cpu_count() or 1)
+        self._pool: queue.SimpleQueue[tuple[int, sqlite3.Connection] | None] = queue.SimpleQueue()
+        for _ in range(pool_size):
+            self._pool.put(None)
+        # The snapshot can lag chat.db, so rowid-keyed watcher reads get
+        # their own connections to chat.db itself
+        self._live_pool: queue.SimpleQueue[tuple[int, sqlite3.Connection] | None] | None = None
+        if self._snapshot is not None:
+            self._live_pool = queue.SimpleQueue()
+            for _ in range(pool_size):
+                self._live_pool.put(None)
+        self._generation = 0
+        self._snapshot_generation = 0  # IndexedSnapshot.generation the pool's connections were opened for
+        self._search_index: MessageSearchIndex | None = MessageSearchIndex(
+            self.db_path,
+            search_index_path or get_sidecar_path(self.db_path, "search.db"),
+        )
+        # Dedicated connection for data_version(), which is tracked per connection
+        self._watch_conn: sqlite3.Connection | None = None
+        self._watch_lock = threading.Lock()
+
+    def _open_connection(self, live: bool = False) -> sqlite3.Connection:
+        """Open a new read-only connection with the session PRAGMAs applied."""
+        # chat.db itself until the first snapshot is in place
+        use_snapshot = self._snapshot is not None and self._snapshot.ready and not live
+        read_path = self._snapshot.snapshot_path if use_snapshot else self.db_path
+        # Open in read-only mode with URI
+        conn = sqlite3.connect(
+            f"file:{read_path}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            # Tuning only; a build that rejects one still reads correctly
+            with suppress(sqlite3.Error):
+                conn.execute(pragma)
+        self._attach_search_index(conn)
+        return conn
+
+    @contextmanager
+    def borrow_read(self, live: bool = False) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read-only connection for the duration of a query.
+
+        Connections are shared across threads but only used by one borrower
+        at a time, so concurrent tools read in parallel up to the pool size.
+        When every pooled connection is out, e.g. a read made while iterating
+        iter_messages, an overflow connection is opened for this borrow and
+        closed afterwards rather than waiting for one to come back.
+
+        Args:
+            live: Read chat.db itself even when an indexed snapshot is in
+                use, for queries that must see the latest commits
+
+        """
+        pool = self._pool
+        if self._live_pool is not None and live:
+            pool = self._live_pool
+        elif self._snapshot is not None:
+            self._snapshot.refresh()
+            if self._snapshot.generation != self._snapshot_generation:
+                # Connections to the replaced snapshot (or to chat.db, before the
+                # first one) are reopened as they come back
+                self._snapshot_generation = self._snapshot.generation
+                self._generation += 1
+
+        try:
+            slot = pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection(live)
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        if slot is not None and slot[0] == self._generation:
+            generation, conn = slot
+        else:
+            if slot is not None:
+                slot[1].close()
+            generation = self._generation
+            try:
+                conn = self._open_connection(live)
+            except BaseException:
+                pool.put(None)
+                raise
+
+        try:
+            yield conn
+        finally:
+            pool.put((generation, conn))
+
+    def check_access(self) -> None:
+        """Read chat.db on a throwaway connection to confirm it is accessible.
+
+        Used for status checks, so a probe neither waits for nor holds a
+        pooled connection and sees revoked access straight away.
+
+        Raises:
+            sqlite3.Error: If chat.db can't be opened or read
+
+        """
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        try:
+            conn.execute("SELECT 1 FROM message LIMIT 1").fetchall()
+        finally:
+            conn.close()
+
+    def _attach_search_index(self, conn: sqlite3.Connection) -> None:
+        """Attach the search sidecar as ``fts``, disabling FTS search if unavailable."""
+        if self._search_index is None:
+            return
+        try:
+            self._search_index.ensure()
+            conn.execute("ATTACH DATABASE ? AS fts", [f"file:{self._search_index.index_path}?mode=ro"])
+        except (OSError, sqlite3.Error):
+            # No FTS5 support or unwritable cache dir: fall back to LIKE search
+            self._search_index = None
+
+    def sync_search_index(self) -> bool:
+        """Index messages added since the last sync, returning False if search can't use FTS."""
+        if self._search_index is None:
+            return False
+        try:
+            self._search_index.sync()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def data_version(self) -> int:
+        """Read chat.db's change counter.
+
+        ``PRAGMA data_version`` only changes when another connection (i.e.
+        Messages.app) commits, so a watcher that saw the same value last
+        time can skip querying the message table entirely. The counter
+        is per connection, so values read before close() aren't comparable.
+        """
+        with self._watch_lock:
+            if self._watch_conn is None:
+                self._watch_conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            return self._watch_conn.execute("PRAGMA data_version").fetchone()[0]
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close idle database connections; borrowed ones are reopened on next use."""
+        with self._watch_lock:
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+                self._watch_conn = None
+        self._generation += 1
+        for pool in (self._pool, self._live_pool):
+            if pool is None:
+                continue
+            for _ in range(pool.qsize()):
+                slot = pool.get()
+                if slot is not None:
+                    slot[1].close()
+                pool.put(None)
+        if self._search_index:
+            self._search_index.close()
 
     def get_messages(
         self,
@@ -151,94 +549,99 @@ class IMessageDatabase:
             List of message dictionaries
 
         """
-        conn = self._get_connection()
+        messages = list(
+            self.iter_messages(limit=limit, chat_id=chat_id, since=since, search=search, unread_only=unread_only)
+        )
+        if chronological:
+            messages.reverse()
+        return messages
+
+    def iter_messages(
+        self,
+        limit: int = 50,
+        chat_id: str | None = None,
+        since: str | None = None,
+        search: str | None = None,
+        unread_only: bool = False,
+    ) -> Iterator[dict]:
+        """Stream messages newest first without materializing the whole result.
+
+        Takes the same filters as get_messages.
+
+        Yields:
+            Message dictionaries
+
+        """
+        query, params = self._prepare_message_query(limit, chat_id, since, search, unread_only)
+        with self.borrow_read() as conn:
+            yield from self._iter_messages(conn.execute(query, params))
+
+    def get_messages_json(
+        self,
+        limit: int = 50,
+        chat_id: str | None = None,
+        since: str | None = None,
+        search: str | None = None,
+        unread_only: bool = False,
+        chronological: bool = False,
+    ) -> str:
+        """Fetch messages as a JSON array built inside SQLite.
+
+        Takes the same filters as get_messages and produces the same fields,
+        except that ``timestamp`` is replaced by ``timestamp_ns`` so no
+        per-row Python conversion is needed. ``timestamp_ns`` is Unix epoch
+        nanoseconds in UTC, treating chat.db's dates as offsets from
+        2001-01-01T00:00:00Z as Apple does. ``timestamp`` instead counts from
+        MAC_EPOCH in local time, so the two differ by the UTC offset.
+
+        Returns:
+            JSON array text, ready to send without a json.dumps round-trip
 
-        query = """
-            SELECT
-                m.rowid as id,
-                m.guid,
-                m.text,
-                m.date as timestamp,
-                m.is_from_me,
-                m.is_read,
-                m.is_sent,
-                m.is_delivered,
-                m.cache_has_attachments as has_attachments,
-                m.associated_message_guid,
-                m.associated_message_type,
-                h.id as sender,
-                c.chat_identifier,
-                c.display_name as chat_name,
-                c.group_id
-            FROM message m
-            LEFT JOIN handle h ON m.handle_id = h.rowid
-            LEFT JOIN chat_message_join cmj ON m.rowid = cmj.message_id
-            LEFT JOIN chat c ON cmj.chat_id = c.rowid
-            WHERE 1=1
         """
+        query, params = self._prepare_message_query(limit, chat_id, since, search, unread_only)
+        if chronological:
+            query = f"SELECT * FROM ({query}) ORDER BY timestamp ASC"
+        with self.borrow_read() as conn:
+            row = conn.execute(f"SELECT {_MESSAGE_JSON_OBJECT} FROM ({query})", params).fetchone()
+        return row[0] or "[]"
+
+    def _prepare_message_query(
+        self,
+        limit: int,
+        chat_id: str | None,
+        since: str | None,
+        search: str | None,
+        unread_only: bool,
+    ) -> tuple[str, list]:
+        """Build the SQL and bind parameters for a get_messages call."""
         params: list = []
 
         if chat_id:
-            query += " AND c.chat_identifier = ?"
             params.append(chat_id)
 
         if since:
             since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
-            since_mac = (since_dt.timestamp() - MAC_EPOCH) * 1_000_000_000
-            query += " AND m.date > ?"
-            params.append(int(since_mac))
+            since_mac = int(since_dt.timestamp() * 1_000_000) * 1000 - MAC_EPOCH_NS
+            params.append(since_mac)
 
+        search_mode = None
         if search:
-            query += " AND m.text LIKE ?"
-            params.append(f"%{search}%")
+            match = to_fts_query(search)
+            if match and self.sync_search_index():
+                search_mode = "fts"
+                params.append(match)
+            else:
+                search_mode = "like"
+                params.append(f"%{search}%")
 
-        if unread_only:
-            query += " AND m.is_read = 0 AND m.is_from_me = 0"
-
-        # Always fetch in DESC order, then reverse if chronological
-        query += " ORDER BY m.date DESC LIMIT ?"
         params.append(limit)
 
-        cursor = conn.execute(query, params)
-        rows = cursor.fetchall()
-
-        messages = [self._row_to_message(row) for row in rows]
-        return list(reversed(messages)) if chronological else messages
-
-    def _row_to_message(self, row: sqlite3.Row) -> dict:
-        """Convert a database row to a message dict with reaction info."""
-        associated_type = row["associated_message_type"] or 0
+        return _MESSAGE_QUERIES[bool(chat_id), bool(since), search_mode, unread_only], params
 
-        # Reaction types: 2000-2005 = add reaction, 3000-3005 = remove reaction
-        is_reaction = associated_type >= 2000
-        reaction_type = None
-        is_reaction_removal = False
-
-        if is_reaction:
-            is_reaction_removal = associated_type >= 3000
-            type_offset = (associated_type % 1000)
-            reaction_map = {0: "love", 1: "like", 2: "dislike", 3: "laugh", 4: "emphasize", 5: "question"}
-            reaction_type = reaction_map.get(type_offset)
-
-        return {
-            "id": row["id"],
-            "guid": row["guid"],
-            "text": row["text"],
-            "timestamp": mac_timestamp_to_iso(row["timestamp"]),
-            "is_from_me": bool(row["is_from_me"]),
-            "is_read": bool(row["is_read"]),
-            "is_sent": bool(row["is_sent"]),
-            "is_delivered": bool(row["is_delivered"]),
-            "has_attachments": bool(row["has_attachments"]),
-            "sender": row["sender"],
-            "chat_identifier": row["chat_identifier"],
-            "chat_name": row["chat_name"],
-            "is_group": bool(row["group_id"]),
-            "is_reaction": is_reaction,
-            "reaction_type": reaction_type,
-            "is_reaction_removal": is_reaction_removal,
-            "associated_message_guid": row["associated_message_guid"],
-        }
+    def _iter_messages(self, cursor: sqlite3.Cursor) -> Iterator[dict]:
+        """Convert cursor rows to message dicts in fetchmany batches."""
+        while batch := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            yield from _rows_to_messages(batch)
 
     def get_unread_messages(self) -> list[dict]:
         """Get all unread messages grouped by sender.
@@ -259,35 +662,43 @@ class IMessageDatabase:
             List of attachment dictionaries
 
         """
-        conn = self._get_connection()
+        return self.get_attachments_for_messages([message_id]).get(message_id, [])
+
+    def get_attachments_for_messages(self, message_ids: list[int]) -> dict[int, list[dict]]:
+        """Get attachments for many messages in a single query.
+
+        The ids are bound as one JSON array, so the SQL text stays constant
+        regardless of how many messages are requested.
+
+        Args:
+            message_ids: Message rowids
+
+        Returns:
+            Dict mapping message rowid to its attachment dictionaries;
+            messages without attachments are omitted
 
+        """
         query = """
             SELECT
+                maj.message_id,
                 a.rowid as id,
                 a.guid,
                 a.filename,
                 a.mime_type,
                 a.transfer_name,
-                a.total_bytes
+                a.total_bytes as size_bytes
             FROM attachment a
             JOIN message_attachment_join maj ON a.rowid = maj.attachment_id
-            WHERE maj.message_id = ?
+            WHERE maj.message_id IN (SELECT value FROM json_each(?))
         """
 
-        cursor = conn.execute(query, [message_id])
-        rows = cursor.fetchall()
+        with self.borrow_read() as conn:
+            rows = _fetch_dicts(conn.execute(query, [json.dumps(message_ids)]))
 
-        return [
-            {
-                "id": row["id"],
-                "guid": row["guid"],
-                "filename": row["filename"],
-                "mime_type": row["mime_type"],
-                "transfer_name": row["transfer_name"],
-                "size_bytes": row["total_bytes"],
-            }
-            for row in rows
-        ]
+        attachments: dict[int, list[dict]] = {}
+        for row in rows:
+            attachments.setdefault(row.pop("message_id"), []).append(row)
+        return attachments
 
     def list_chats(self, limit: int = 50) -> list[dict]:
         """List all chats/conversations.
@@ -299,8 +710,6 @@ class IMessageDatabase:
             List of chat dictionaries with metadata
 
         """
-        conn = self._get_connection()
-
         query = """
             SELECT
                 c.rowid as id,
@@ -308,36 +717,44 @@ class IMessageDatabase:
                 c.display_name,
                 c.group_id,
                 c.service_name,
-                (
-                    SELECT COUNT(*)
-                    FROM chat_message_join cmj
-                    WHERE cmj.chat_id = c.rowid
-                ) as message_count,
-                (
-                    SELECT MAX(m.date)
-                    FROM message m
-                    JOIN chat_message_join cmj ON m.rowid = cmj.message_id
-                    WHERE cmj.chat_id = c.rowid
-                ) as last_message_date
+                s.message_count,
+                s.last_message_date
             FROM chat c
+            LEFT JOIN (
+                SELECT
+                    cmj.chat_id,
+                    COUNT(*) as message_count,
+                    MAX(m.date) as last_message_date
+                FROM chat_message_join cmj
+                JOIN message m ON m.rowid = cmj.message_id
+                GROUP BY cmj.chat_id
+            ) s ON s.chat_id = c.rowid
             ORDER BY last_message_date DESC
             LIMIT ?
         """
 
-        cursor = conn.execute(query, [limit])
-        rows = cursor.fetchall()
+        with self.borrow_read() as conn:
+            rows = conn.execute(query, [limit]).fetchall()
 
         return [
             {
-                "id": row["id"],
-                "chat_identifier": row["chat_identifier"],
-                "display_name": row["display_name"],
-                "is_group": bool(row["group_id"]),
-                "service": row["service_name"],
-                "message_count": row["message_count"],
-                "last_message": mac_timestamp_to_iso(row["last_message_date"]),
+                "id": chat_rowid,
+                "chat_identifier": chat_identifier,
+                "display_name": display_name,
+                "is_group": bool(group_id),
+                "service": service_name,
+                "message_count": message_count,
+                "last_message": mac_timestamp_to_iso(last_message_date),
             }
-            for row in rows
+            for (
+                chat_rowid,
+                chat_identifier,
+                display_name,
+                group_id,
+                service_name,
+                message_count,
+                last_message_date,
+            ) in rows
         ]
 
     def get_chat_participants(self, chat_identifier: str) -> list[dict]:
@@ -350,20 +767,16 @@ class IMessageDatabase:
             List of participant dictionaries
 
         """
-        conn = self._get_connection()
-
         query = """
-            SELECT DISTINCT h.id, h.service
+            SELECT DISTINCT h.id as handle, h.service
             FROM handle h
             JOIN chat_handle_join chj ON h.rowid = chj.handle_id
             JOIN chat c ON chj.chat_id = c.rowid
             WHERE c.chat_identifier = ?
         """
 
-        cursor = conn.execute(query, [chat_identifier])
-        rows = cursor.fetchall()
-
-        return [{"handle": row["id"], "service": row["service"]} for row in rows]
+        with self.borrow_read() as conn:
+            return _fetch_dicts(conn.execute(query, [chat_identifier]))
 
     def get_latest_message_id(self) -> int:
         """Get the ID of the most recent message.
@@ -372,12 +785,27 @@ class IMessageDatabase:
             Latest message rowid, or 0 if no messages
 
         """
-        conn = self._get_connection()
-        cursor = conn.execute("SELECT MAX(rowid) FROM message")
-        row = cursor.fetchone()
+        with self.borrow_read(live=True) as conn:
+            row = conn.execute(_LATEST_MESSAGE_ID_QUERY).fetchone()
         return row[0] or 0
 
-    def get_messages_since_id(self, since_id: int, limit: int = 50) -> list[dict]:
+    def get_recent_messages(self, limit: int) -> list[dict]:
+        """Get the most recently added messages.
+
+        Args:
+            limit: Maximum messages to return
+
+        Returns:
+            List of messages (oldest first), so the last one's id is the
+            latest message id
+
+        """
+        with self.borrow_read(live=True) as conn:
+            messages = list(self._iter_messages(conn.execute(_RECENT_MESSAGES_QUERY, [limit])))
+        messages.reverse()
+        return messages
+
+    def get_messages_since_id(self, since_id: int, limit: int = 500) -> list[dict]:
         """Get messages newer than a specific message ID.
 
         Args:
@@ -385,38 +813,22 @@ class IMessageDatabase:
             limit: Maximum messages to return
 
         Returns:
-            List of new messages (oldest first)
+            List of new messages (oldest first), so the last one's id is the
+            next cursor
 
         """
-        conn = self._get_connection()
+        return list(self.iter_messages_since_id(since_id, limit))
 
-        query = """
-            SELECT
-                m.rowid as id,
-                m.guid,
-                m.text,
-                m.date as timestamp,
-                m.is_from_me,
-                m.is_read,
-                m.is_sent,
-                m.is_delivered,
-                m.cache_has_attachments as has_attachments,
-                m.associated_message_guid,
-                m.associated_message_type,
-                h.id as sender,
-                c.chat_identifier,
-                c.display_name as chat_name,
-                c.group_id
-            FROM message m
-            LEFT JOIN handle h ON m.handle_id = h.rowid
-            LEFT JOIN chat_message_join cmj ON m.rowid = cmj.message_id
-            LEFT JOIN chat c ON cmj.chat_id = c.rowid
-            WHERE m.rowid > ?
-            ORDER BY m.rowid ASC
-            LIMIT ?
-        """
+    def iter_messages_since_id(self, since_id: int, limit: int = 500) -> Iterator[dict]:
+        """Stream messages newer than a specific message ID, oldest first.
 
-        cursor = conn.execute(query, [since_id, limit])
-        rows = cursor.fetchall()
+        Args:
+            since_id: Message ID to start from (exclusive)
+            limit: Maximum messages to return
+
+        Yields:
+            Message dictionaries
 
-        return [self._row_to_message(row) for row in rows]
+        """
+        with self.borrow_read(live=True) as conn:
+            yield from self._iter_messages(conn.execute(_MESSAGES_SINCE_ID_QUERY, [since_id, limit]))
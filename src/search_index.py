@@ -0,0 +1,199 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Full-text search index over iMessage text.
+
+chat.db is opened read-only, so the FTS5 index lives in a sidecar database
+and is kept in sync incrementally by message ROWID.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+
+
+# Bump when the index schema or tokenizer changes to force a rebuild
+SCHEMA_VERSION = 4
+
+# Trigram indexing keeps the substring semantics of the LIKE search it
+# replaces: mid-word matches and scripts written without spaces. Diacritic
+# folding needs SQLite 3.45+, so older builds get plain trigram.
+_TOKENIZERS = ("trigram remove_diacritics 1", "trigram")
+
+# Finding edited or unsent messages scans chat.db's message table, so it runs
+# at most this often (seconds) rather than on every sync
+_EDIT_SCAN_INTERVAL = 60.0
+
+
+def _source_identity(db_path: str) -> str:
+    """Identify a chat.db file, so an index built from another one is noticed."""
+    st = os.stat(db_path)
+    return f"{os.path.realpath(db_path)}:{st.st_dev}:{st.st_ino}"
+
+
+def to_fts_query(search: str) -> str:
+    """Convert free text into an FTS5 query for a substring match.
+
+    The whole search is quoted as one phrase, so FTS5 operators (``-``,
+    ``OR``, ``NEAR``, ...) are literal text. Against the trigram index a
+    phrase matches wherever the text contains it, case-insensitively, like
+    the ``LIKE`` search did.
+
+    Args:
+        search: Raw user search text
+
+    Returns:
+        FTS5 MATCH expression, or an empty string if the search is shorter
+        than a trigram and can't use the index; callers should run those
+        as ``LIKE``
+
+    """
+    if len(search) < 3:
+        return ""
+    return '"' + search.replace('"', '""') + '"'
+
+
+class MessageSearchIndex:
+    """Trigram FTS5 index of ``message.text`` stored next to chat.db.
+
+    The indexed text is kept in the index too (rather than contentless), so
+    edited and unsent messages can be re-indexed on SQLite builds without
+    contentless-delete support.
+    """
+
+    def __init__(self, db_path: str, index_path: str) -> None:
+        """Initialize the search index.
+
+        Args:
+            db_path: Path to chat.db
+            index_path: Path to the sidecar index database
+
+        """
+        self.db_path = db_path
+        self.index_path = index_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._has_edit_columns = False
+        self._edits_checked_at: float | None = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the writable index connection with chat.db attached."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.index_path, check_same_thread=False)
+            try:
+                # WAL so searches reading through the fts attachment aren't blocked while sync() writes
+                conn.execute("PRAGMA journal_mode = WAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                    self._create_schema(conn)
+                conn.execute("ATTACH DATABASE ? AS chat", [f"file:{self.db_path}?mode=ro"])
+                # Only macOS 13+ records edits and unsends
+                columns = {row[1] for row in conn.execute("PRAGMA chat.table_info(message)")}
+                self._has_edit_columns = {"date_edited", "date_retracted"} <= columns
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        """(Re)create the index tables with the best trigram tokenizer this SQLite has."""
+        conn.executescript("DROP TABLE IF EXISTS message_fts; DROP TABLE IF EXISTS sync_state;")
+        for tokenizer in _TOKENIZERS:
+            try:
+                conn.execute(f"CREATE VIRTUAL TABLE message_fts USING fts5(text, tokenize='{tokenizer}')")
+                break
+            except sqlite3.OperationalError:
+                if tokenizer == _TOKENIZERS[-1]:
+                    raise
+        conn.executescript(
+            f"""
+            CREATE TABLE sync_state (
+                last_rowid INTEGER NOT NULL,
+                source TEXT,
+                edit_mark INTEGER NOT NULL
+            );
+            INSERT INTO sync_state VALUES (0, NULL, 0);
+            PRAGMA user_version = {SCHEMA_VERSION};
+            """
+        )
+
+    def ensure(self) -> None:
+        """Create the index database if it does not exist yet."""
+        with self._lock:
+            self._get_connection()
+
+    def sync(self) -> None:
+        """Index messages added to chat.db since the last sync.
+
+        The index is rebuilt from scratch if it was built from a different
+        chat.db (another path, or the file was replaced) or rowids went
+        backwards. Edited and unsent messages are re-indexed every
+        ``_EDIT_SCAN_INTERVAL`` seconds.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            source = _source_identity(self.db_path)
+            with conn:
+                last_rowid, indexed_source, edit_mark = conn.execute(
+                    "SELECT last_rowid, source, edit_mark FROM sync_state"
+                ).fetchone()
+                latest_rowid = conn.execute("SELECT MAX(rowid) FROM chat.message").fetchone()[0] or 0
+                if indexed_source != source or latest_rowid < last_rowid:
+                    conn.execute("DELETE FROM message_fts")
+                    conn.execute("UPDATE sync_state SET last_rowid = 0, source = ?, edit_mark = 0", [source])
+                    last_rowid, edit_mark = 0, 0
+                    self._edits_checked_at = None
+
+                if latest_rowid > last_rowid:
+                    conn.execute(
+                        """
+                        INSERT INTO message_fts (rowid, text)
+                        SELECT rowid, text FROM chat.message
+                        WHERE rowid > ? AND rowid <= ? AND text IS NOT NULL
+                        """,
+                        [last_rowid, latest_rowid],
+                    )
+                    conn.execute("UPDATE sync_state SET last_rowid = ?", [latest_rowid])
+
+                self._reindex_edits(conn, last_rowid, edit_mark)
+
+    def _reindex_edits(self, conn: sqlite3.Connection, last_rowid: int, edit_mark: int) -> None:
+        """Re-index already indexed messages edited or unsent since edit_mark."""
+        now = time.monotonic()
+        if not self._has_edit_columns or (
+            self._edits_checked_at is not None and now - self._edits_checked_at < _EDIT_SCAN_INTERVAL
+        ):
+            return
+        self._edits_checked_at = now
+
+        rows = conn.execute(
+            """
+            SELECT rowid, text, MAX(date_edited, date_retracted) FROM chat.message
+            WHERE rowid <= ? AND MAX(date_edited, date_retracted) > ?
+            """,
+            [last_rowid, edit_mark],
+        ).fetchall()
+        if not rows:
+            return
+        conn.executemany("DELETE FROM message_fts WHERE rowid = ?", [(rowid,) for rowid, _, _ in rows])
+        conn.executemany(
+            "INSERT INTO message_fts (rowid, text) VALUES (?, ?)",
+            [(rowid, text) for rowid, text, _ in rows if text is not None],
+        )
+        conn.execute("UPDATE sync_state SET edit_mark = ?", [max(mark for _, _, mark in rows)])
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            if self._conn:
+                # chat.db is read-only, but the index can keep planner stats fresh
+                with contextlib.suppress(sqlite3.Error):
+                    self._conn.execute("PRAGMA optimize")
+                self._conn.close()
+                self._conn = None
@@ -8,15 +8,356 @@ Uses osascript to control Messages.app on macOS.
 
 from __future__ import annotations
 
+import functools
+import json
+import select
 import subprocess
+import threading
+import time
+from collections.abc import Callable
+from typing import ParamSpec
+
+from contacts_sqlite import load_contacts
+
+
+P = ParamSpec("P")
+
+
+# Characters that must be escaped inside an AppleScript string literal. NUL
+# can't be represented in script source at all, so it is dropped.
+_APPLESCRIPT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\0": None})
+
+
+# Every send script starts with this, so it fails with -600 itself when
+# Messages.app isn't running and callers needn't check first
+_MESSAGES_RUNNING_GUARD = '''
+            if not (application "Messages" is running) then
+                error "Messages.app is not running. Please open it first." number -600
+            end if'''
+
+# Single-send scripts take their values as run handler arguments, so the
+# source never changes, the worker compiles each one once, and no user text
+# is ever spliced into AppleScript source.
+_SEND_BUDDY_SCRIPT = '''
+        on run {targetRecipient, messageText}''' + _MESSAGES_RUNNING_GUARD + '''
+            tell application "Messages"
+                set targetService to 1st service whose service type = iMessage
+                set targetBuddy to buddy targetRecipient of targetService
+                send messageText to targetBuddy
+            end tell
+        end run
+    '''
+
+_SEND_CHAT_SCRIPT = '''
+        on run {targetChatId, messageText}''' + _MESSAGES_RUNNING_GUARD + '''
+            tell application "Messages"
+                set targetChat to chat id targetChatId
+                send messageText to targetChat
+            end tell
+        end run
+    '''
+
+# Attachment scripts take an empty messageText to send the file alone
+_SEND_FILE_BUDDY_SCRIPT = '''
+        on run {targetRecipient, filePath, messageText}''' + _MESSAGES_RUNNING_GUARD + '''
+            tell application "Messages"
+                set targetService to 1st service whose service type = iMessage
+                set targetBuddy to buddy targetRecipient of targetService
+                if messageText is not "" then send messageText to targetBuddy
+                send (POSIX file filePath) to targetBuddy
+            end tell
+        end run
+    '''
+
+_SEND_FILE_CHAT_SCRIPT = '''
+        on run {targetChatId, filePath, messageText}''' + _MESSAGES_RUNNING_GUARD + '''
+            tell application "Messages"
+                set targetChat to chat id targetChatId
+                if messageText is not "" then send messageText to targetChat
+                send (POSIX file filePath) to targetChat
+            end tell
+        end run
+    '''
+
+# Batch sends take {messageText, filePath, recipient...} so, like the
+# single sends, one fixed script is compiled once whatever the batch size. An
+# empty messageText or filePath skips that part. Each recipient reports OK or
+# ERR:<message>, separated by ASCII record separators, so one bad recipient
+# doesn't stop the rest.
+_SEND_BATCH_SCRIPT = '''
+        on run argv''' + _MESSAGES_RUNNING_GUARD + '''
+            set messageText to item 1 of argv
+            set filePath to item 2 of argv
+            set results to {}
+            tell application "Messages"
+                set targetService to 1st service whose service type = iMessage
+                repeat with targetRecipient in items 3 thru -1 of argv
+                    try
+                        set targetBuddy to buddy (contents of targetRecipient) of targetService
+                        if messageText is not "" then send messageText to targetBuddy
+                        if filePath is not "" then send (POSIX file filePath) to targetBuddy
+                        set end of results to "OK"
+                    on error errMsg
+                        set end of results to "ERR:" & errMsg
+                    end try
+                end repeat
+            end tell
+            set AppleScript's text item delimiters to (ASCII character 30)
+            return results as text
+        end run
+    '''
+
+
+# JXA host that compiles and runs one AppleScript per request. Requests and
+# responses are single JSON lines so scripts and results may contain newlines.
+# Requests with "args" call the script's run handler with them, the same as
+# `osascript -e script arg...`, and keep the compiled script for reuse.
+# JavaScript requests are a function body that gets `argv` and returns a string.
+_WORKER_SCRIPT = """
+ObjC.import("Foundation");
+
+function runHandlerEvent(args) {
+    // 'aevt'/'oapp' with the arguments as the direct object list
+    const event = $.NSAppleEventDescriptor.appleEventWithEventClassEventIDTargetDescriptorReturnIDTransactionID(
+        0x61657674, 0x6f617070, $.NSAppleEventDescriptor.nullDescriptor, -1, 0
+    );
+    const argv = $.NSAppleEventDescriptor.listDescriptor;
+    args.forEach((arg, i) => argv.insertDescriptorAtIndex($.NSAppleEventDescriptor.descriptorWithString(arg), i + 1));
+    event.setParamDescriptorForKeyword(argv, 0x2d2d2d2d);
+    return event;
+}
+
+function runAppleScript(request, compiled) {
+    let script = request.args ? compiled.get(request.script) : undefined;
+    if (script === undefined) {
+        script = $.NSAppleScript.alloc.initWithSource(request.script);
+        if (request.args) {
+            compiled.set(request.script, script);
+        }
+    }
+    const error = Ref();
+    const result = request.args
+        ? script.executeAppleEventError(runHandlerEvent(request.args), error)
+        : script.executeAndReturnError(error);
+    if (result.isNil()) {
+        const info = error[0];
+        return {
+            ok: false,
+            error: ObjC.unwrap(info.objectForKey("NSAppleScriptErrorMessage")) || "",
+            number: ObjC.unwrap(info.objectForKey("NSAppleScriptErrorNumber")),
+        };
+    }
+    return {ok: true, result: ObjC.unwrap(result.stringValue) || ""};
+}
+
+function runJavaScript(request, compiled) {
+    const key = "js:" + request.script;
+    let fn = compiled.get(key);
+    if (fn === undefined) {
+        fn = new Function("argv", request.script);
+        compiled.set(key, fn);
+    }
+    try {
+        const result = fn(request.args || []);
+        return {ok: true, result: result === undefined || result === null ? "" : String(result)};
+    } catch (e) {
+        return {ok: false, error: String(e && e.message ? e.message : e), number: e && e.errorNumber};
+    }
+}
+
+function run() {
+    const input = $.NSFileHandle.fileHandleWithStandardInput;
+    const output = $.NSFileHandle.fileHandleWithStandardOutput;
+    const compiled = new Map();
+    let buffer = "";
+    for (;;) {
+        const data = input.availableData;
+        if (data.length === 0) {
+            return "";
+        }
+        buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+        let newline;
+        while ((newline = buffer.indexOf("\\n")) >= 0) {
+            const request = JSON.parse(buffer.slice(0, newline));
+            buffer = buffer.slice(newline + 1);
+            const response = request.language === "JavaScript"
+                ? runJavaScript(request, compiled)
+                : runAppleScript(request, compiled);
+            output.writeData($(JSON.stringify(response) + "\\n").dataUsingEncoding($.NSUTF8StringEncoding));
+        }
+    }
+}
+"""
+
+
+class _OsaWorker:
+    """Long-lived osascript process that runs AppleScript sent over stdin.
+
+    Spawning osascript costs tens of milliseconds per call, so scripts are
+    piped to one persistent JXA host instead.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _kill(self) -> None:
+        """Stop the worker; the next run() starts a fresh one."""
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def run(
+        self, script: str, timeout: float, args: list[str] | None = None, language: str = "AppleScript"
+    ) -> subprocess.CompletedProcess:
+        """Run an AppleScript, or a JXA function body, in the worker.
+
+        Args:
+            script: AppleScript source, or for JavaScript the body of a
+                function taking ``argv`` and returning a string
+            timeout: Seconds to wait for the result
+            args: Arguments for the script's run handler; scripts run with
+                arguments are compiled once and cached by the worker
+            language: "AppleScript" or "JavaScript"
+
+        Returns:
+            CompletedProcess shaped like a one-off osascript call
+
+        Raises:
+            OSError: If the worker could not be started or sent the script,
+                in which case the script did not run
+            subprocess.TimeoutExpired: If the script did not finish in time
+
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(
+                    ["osascript", "-l", "JavaScript", "-e", _WORKER_SCRIPT],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            proc = self._proc
+
+            try:
+                request = {"script": script, "language": language}
+                if args is not None:
+                    request["args"] = args
+                proc.stdin.write(json.dumps(request).encode() + b"\n")
+                proc.stdin.flush()
+            except OSError:
+                self._kill()
+                raise
+
+            ready, _, _ = select.select([proc.stdout], [], [], timeout)
+            if not ready:
+                self._kill()
+                raise subprocess.TimeoutExpired("osascript", timeout)
+
+            line = proc.stdout.readline()
+            if not line:
+                # The script may already have run, so don't let callers retry it
+                self._kill()
+                return subprocess.CompletedProcess(proc.args, 1, "", "AppleScript worker exited")
+
+        response = json.loads(line)
+        if response["ok"]:
+            return subprocess.CompletedProcess(proc.args, 0, response["result"], "")
+        return subprocess.CompletedProcess(proc.args, 1, "", response["error"])
+
+
+_worker = _OsaWorker()
+
+
+def _run_applescript(
+    script: str, timeout: float, args: list[str] | None = None, *, want_output: bool = True
+) -> subprocess.CompletedProcess:
+    """Run an AppleScript, preferring the persistent worker over a fresh osascript.
+
+    ``args`` are passed to the script's ``on run`` handler. Callers that only
+    check for errors pass ``want_output=False`` so a fallback osascript's
+    stdout is discarded rather than captured and decoded.
+    """
+    try:
+        return _worker.run(script, timeout, args)
+    except OSError:
+        # Script source on stdin rather than in argv, so long scripts aren't copied through execve
+        return subprocess.run(
+            ["osascript", "-", *(args or [])],
+            input=script,
+            stdout=subprocess.PIPE if want_output else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
+
+
+def _run_jxa(body: str, timeout: float, args: list[str] | None = None) -> subprocess.CompletedProcess:
+    """Run a JXA function body, taking ``argv`` and returning a string, like _run_applescript."""
+    try:
+        return _worker.run(body, timeout, args, language="JavaScript")
+    except OSError:
+        return subprocess.run(
+            ["osascript", "-l", "JavaScript", "-", *(args or [])],
+            input="function run(argv) {\n" + body + "\n}",
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
 
 
 def escape_applescript_string(text: str) -> str:
-    """Escape special characters for AppleScript strings."""
-    return text.replace("\\", "\\\\").replace('"', '\\"')
+    """Escape special characters for AppleScript strings (without surrounding quotes)."""
+    return text.translate(_APPLESCRIPT_ESCAPES)
+
 
+def quote_applescript_string(text: str) -> str:
+    """Quote text as a complete AppleScript string literal, including the quotes."""
+    return '"' + text.translate(_APPLESCRIPT_ESCAPES) + '"'
 
-def send_message(recipient: str, text: str) -> dict:
+
+def _osa_send(
+    timeout: float, ok_fields: Callable[..., dict]
+) -> Callable[[Callable[P, tuple[str, list[str]]]], Callable[P, dict]]:
+    """Turn a function returning (script, run handler args) into a send call.
+
+    The wrapped function runs the script and returns the usual result dict:
+    ``{"success": True, **ok_fields(...)}`` on success, or ``success`` False
+    with an ``error`` message on failure or timeout.
+
+    Args:
+        timeout: Seconds to wait for the script
+        ok_fields: Called with the send's arguments to build the success fields
+
+    """
+
+    def decorator(build: Callable[P, tuple[str, list[str]]]) -> Callable[P, dict]:
+        @functools.wraps(build)
+        def send(*args: P.args, **kwargs: P.kwargs) -> dict:
+            try:
+                script, script_args = build(*args, **kwargs)
+                result = _run_applescript(script, timeout=timeout, args=script_args, want_output=False)
+                if result.returncode == 0:
+                    return {"success": True, **ok_fields(*args, **kwargs)}
+                error = result.stderr.strip() or "Unknown AppleScript error"
+            except subprocess.TimeoutExpired:
+                error = "AppleScript execution timed out"
+            except Exception as e:
+                error = str(e)
+            # A failed send may mean Messages.app went away; re-probe next time
+            invalidate_messages_app_check()
+            return {"success": False, "error": error}
+
+        return send
+
+    return decorator
+
+
+@_osa_send(timeout=30, ok_fields=lambda recipient, text: {"recipient": recipient})
+def send_message(recipient: str, text: str) -> tuple[str, list[str]]:
     """Send a text message via iMessage.
 
     Args:
@@ -27,41 +368,55 @@ def send_message(recipient: str, text: str) -> dict:
         Dict with success status and any error message
 
     """
-    escaped_text = escape_applescript_string(text)
-    escaped_recipient = escape_applescript_string(recipient)
-
-    script = f'''
-        tell application "Messages"
-            set targetService to 1st service whose service type = iMessage
-            set targetBuddy to buddy "{escaped_recipient}" of targetService
-            send "{escaped_text}" to targetBuddy
-        end tell
-    '''
+    return _SEND_BUDDY_SCRIPT, [recipient, text]
+
+
+def send_message_batch(recipients: list[str], text: str, file_path: str | None = None) -> list[dict]:
+    """Send the same text, file, or both to several recipients in one AppleScript run.
+
+    Args:
+        recipients: Phone numbers or email addresses
+        text: Message text to send, or "" to send only the file
+        file_path: Optional absolute path to a file sent after the text
+
+    Returns:
+        One dict per recipient, in order, with success status and any error message
+
+    """
+    if not recipients:
+        return []
 
+    fields = {"file": file_path} if file_path else {}
+    timeout = 60 + 10 * len(recipients) if file_path else 30 + 5 * len(recipients)
     try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            check=False,
-        )
+        result = _run_applescript(_SEND_BATCH_SCRIPT, timeout=timeout, args=[text, file_path or "", *recipients])
 
         if result.returncode != 0:
-            return {
-                "success": False,
-                "error": result.stderr.strip() or "Unknown AppleScript error",
-            }
-
-        return {"success": True, "recipient": recipient}
+            invalidate_messages_app_check()
+            error = result.stderr.strip() or "Unknown AppleScript error"
+            return [{"success": False, "recipient": recipient, "error": error} for recipient in recipients]
+
+        statuses = result.stdout.strip().split("\x1e")
+        results = []
+        for i, recipient in enumerate(recipients):
+            status = statuses[i] if i < len(statuses) else "ERR:No result from AppleScript"
+            if status == "OK":
+                results.append({"success": True, "recipient": recipient, **fields})
+            else:
+                error = status.removeprefix("ERR:") or "Unknown AppleScript error"
+                results.append({"success": False, "recipient": recipient, "error": error})
+        return results
 
     except subprocess.TimeoutExpired:
-        return {"success": False, "error": "AppleScript execution timed out"}
+        invalidate_messages_app_check()
+        return [{"success": False, "recipient": r, "error": "AppleScript execution timed out"} for r in recipients]
     except Exception as e:
-        return {"success": False, "error": str(e)}
+        invalidate_messages_app_check()
+        return [{"success": False, "recipient": recipient, "error": str(e)} for recipient in recipients]
 
 
-def send_to_chat(chat_id: str, text: str) -> dict:
+@_osa_send(timeout=30, ok_fields=lambda chat_id, text: {"chat_id": chat_id})
+def send_to_chat(chat_id: str, text: str) -> tuple[str, list[str]]:
     """Send a message to a group chat by chat ID.
 
     Args:
@@ -72,60 +427,53 @@ def send_to_chat(chat_id: str, text: str) -> dict:
         Dict with success status and any error message
 
     """
-    escaped_text = escape_applescript_string(text)
-    escaped_chat_id = escape_applescript_string(chat_id)
+    return _SEND_CHAT_SCRIPT, [chat_id, text]
 
-    script = f'''
-        tell application "Messages"
-            set targetChat to chat id "{escaped_chat_id}"
-            send "{escaped_text}" to targetChat
-        end tell
-    '''
 
-    try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            check=False,
-        )
-
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "error": result.stderr.strip() or "Unknown AppleScript error",
-            }
-
-        return {"success": True, "chat_id": chat_id}
-
-    except subprocess.TimeoutExpired:
-        return {"success": False, "error": "AppleScript execution timed out"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+# Seconds a check_messages_app answer is reused; it changes at human timescales
+_CHECK_TTL = 2.0
+_last_check: tuple[float, dict] | None = None
+_check_lock = threading.Lock()
 
 
 def check_messages_app() -> dict:
     """Check if Messages.app is running and accessible.
 
+    Answers are reused for ``_CHECK_TTL`` seconds, and concurrent callers
+    share a single AppleScript probe.
+
     Returns:
         Dict with messages_running bool and any error
 
     """
+    global _last_check
+    with _check_lock:
+        if _last_check is not None and time.monotonic() - _last_check[0] < _CHECK_TTL:
+            return dict(_last_check[1])
+        status = _check_messages_app_uncached()
+        _last_check = (time.monotonic(), status)
+        return dict(status)
+
+
+def invalidate_messages_app_check() -> None:
+    """Forget the memoized check_messages_app answer."""
+    global _last_check
+    with _check_lock:
+        _last_check = None
+
+
+def _check_messages_app_uncached() -> dict:
+    """Probe Messages.app through System Events."""
+    # Returned as text: the worker reads results through stringValue, which
+    # a bare boolean descriptor isn't guaranteed to coerce to
     script = '''
         tell application "System Events"
-            return (name of processes) contains "Messages"
+            return ((name of processes) contains "Messages") as text
         end tell
     '''
 
     try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            check=False,
-        )
+        result = _run_applescript(script, timeout=10)
 
         is_running = result.stdout.strip().lower() == "true"
 
@@ -138,7 +486,11 @@ def check_messages_app() -> dict:
         return {"messages_running": False, "error": str(e)}
 
 
-def send_attachment(recipient: str, file_path: str, text: str | None = None) -> dict:
+@_osa_send(
+    timeout=60,
+    ok_fields=lambda recipient, file_path, text=None: {"recipient": recipient, "file": file_path},
+)
+def send_attachment(recipient: str, file_path: str, text: str | None = None) -> tuple[str, list[str]]:
     """Send a file attachment via iMessage.
 
     Args:
@@ -150,51 +502,119 @@ def send_attachment(recipient: str, file_path: str, text: str | None = None) ->
         Dict with success status
 
     """
-    escaped_recipient = escape_applescript_string(recipient)
-    escaped_path = escape_applescript_string(file_path)
+    return _SEND_FILE_BUDDY_SCRIPT, [recipient, file_path, text or ""]
+
+
+# JXA reads each property for every matching person in bulk (one Apple event
+# per property rather than per contact) and returns the contacts as JSON.
+# An optional argv[0] limits the search to names containing it.
+_CONTACTS_JXA = """
+    const Contacts = Application("Contacts");
+    const people = argv.length ? Contacts.people.whose({name: {_contains: argv[0]}}) : Contacts.people;
+    const names = people.name();
+    const phones = people.phones.value();
+    const emails = people.emails.value();
+    return JSON.stringify(names.map((name, i) => ({name: name, phones: phones[i], emails: emails[i]})));
+"""
 
-    if text:
-        escaped_text = escape_applescript_string(text)
-        script = f'''
-            tell application "Messages"
-                set targetService to 1st service whose service type = iMessage
-                set targetBuddy to buddy "{escaped_recipient}" of targetService
-                send "{escaped_text}" to targetBuddy
-                send POSIX file "{escaped_path}" to targetBuddy
-            end tell
-        '''
-    else:
-        script = f'''
-            tell application "Messages"
-                set targetService to 1st service whose service type = iMessage
-                set targetBuddy to buddy "{escaped_recipient}" of targetService
-                send POSIX file "{escaped_path}" to targetBuddy
-            end tell
-        '''
 
-    try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            check=False,
-        )
+def _parse_contacts(output: str) -> list[dict]:
+    """Parse _CONTACTS_JXA output into contact dicts, skipping unnamed people."""
+    return [
+        {"name": c["name"], "phones": c["phones"] or [], "emails": c["emails"] or []}
+        for c in json.loads(output or "[]")
+        if c["name"]
+    ]
 
-        if result.returncode != 0:
-            return {"success": False, "error": result.stderr.strip() or "AppleScript error"}
 
-        return {"success": True, "recipient": recipient, "file": file_path}
+class _ContactIndex:
+    """In-memory copy of every contact, searched without asking Contacts.app.
 
-    except subprocess.TimeoutExpired:
-        return {"success": False, "error": "Timeout"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    Stored as parallel lists so a search is a single pass over the
+    lowercased names. Contacts rarely change mid-session, so the copy is
+    re-read from Contacts.app only every few minutes or on refresh_contacts().
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self.names: list[str] = []
+        self.names_lc: list[str] = []
+        self.phones: list[list[str]] = []
+        self.emails: list[list[str]] = []
+        self._loaded_at: float | None = None
+        # After a failed dump, searches fall back to per-query JXA lookups
+        # until the TTL passes instead of retrying the slow dump every call
+        self._failed_at: float | None = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Force the next search to re-read Contacts.app."""
+        with self._lock:
+            self._loaded_at = None
+            self._failed_at = None
+
+    def _load(self) -> bool:
+        """Replace the index with a fresh dump; returns False if it failed.
+
+        Reads the AddressBook databases directly when possible, and only asks
+        Contacts.app through JXA when they can't be read.
+        """
+        contacts = load_contacts()
+        if contacts is None:
+            contacts = self._load_from_contacts_app()
+            if contacts is None:
+                return False
+
+        self.names = [c["name"] for c in contacts]
+        self.names_lc = [name.casefold() for name in self.names]
+        self.phones = [c["phones"] for c in contacts]
+        self.emails = [c["emails"] for c in contacts]
+        self._loaded_at = time.monotonic()
+        return True
+
+    def _load_from_contacts_app(self) -> list[dict] | None:
+        """Dump every contact through JXA, or None if that failed."""
+        try:
+            result = _run_jxa(_CONTACTS_JXA, timeout=60)
+            if result.returncode != 0:
+                return None
+            return _parse_contacts(result.stdout)
+        except Exception:
+            return None
+
+    def search(self, query: str) -> list[dict] | None:
+        """Contacts whose name contains query, or None if Contacts couldn't be read."""
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded_at is None or now - self._loaded_at >= self._ttl:
+                if self._failed_at is not None and now - self._failed_at < self._ttl:
+                    return None
+                if not self._load():
+                    self._failed_at = now
+                    return None
+                self._failed_at = None
+            query_lc = query.casefold()
+            return [
+                {"name": self.names[i], "phones": list(self.phones[i]), "emails": list(self.emails[i])}
+                for i, name in enumerate(self.names_lc)
+                if query_lc in name
+            ]
+
+
+_contact_index = _ContactIndex(ttl=300.0)
+
+
+def refresh_contacts() -> None:
+    """Drop the cached contact list so the next search re-reads Contacts.app."""
+    _contact_index.invalidate()
 
 
 def search_contacts(query: str) -> list[dict]:
     """Search macOS Contacts by name.
 
+    Searches an in-memory copy of all contacts that is refreshed every five
+    minutes; call refresh_contacts() to see Contacts edits sooner.
+
     Args:
         query: Name to search for
 
@@ -202,59 +622,38 @@ def search_contacts(query: str) -> list[dict]:
         List of matching contacts with phones/emails
 
     """
-    escaped_query = escape_applescript_string(query)
-
-    script = f'''
-        set output to ""
-        tell application "Contacts"
-            set matchedPeople to (every person whose name contains "{escaped_query}")
-            repeat with p in matchedPeople
-                set n to name of p
-                set ph to ""
-                set em to ""
-                repeat with x in phones of p
-                    set ph to ph & (value of x) & "|"
-                end repeat
-                repeat with x in emails of p
-                    set em to em & (value of x) & "|"
-                end repeat
-                set output to output & n & "	" & ph & "	" & em & "\n"
-            end repeat
-        end tell
-        return output
-    '''
+    query = query.strip()
+    contacts = _contact_index.search(query)
+    if contacts is None:
+        # Fall back to asking Contacts.app for just this query
+        contacts = _search_contacts_uncached(query)
+    return contacts or []
+
 
+def _search_contacts_uncached(query: str) -> list[dict] | None:
+    """Search Contacts.app through JXA.
+
+    Returns:
+        Matching contacts, or None if the lookup failed
+
+    """
     try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=15,
-            check=False,
-        )
+        result = _run_jxa(_CONTACTS_JXA, timeout=15, args=[query])
 
         if result.returncode != 0:
-            return []
-
-        contacts = []
-        for line in result.stdout.split("\n"):
-            if not line.strip():
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 2:
-                name = parts[0].strip()
-                phones = [p.strip() for p in parts[1].split("|") if p.strip()]
-                emails = [e.strip() for e in parts[2].split("|") if e.strip()] if len(parts) > 2 else []
-                if name:
-                    contacts.append({"name": name, "phones": phones, "emails": emails})
-
-        return contacts
+            return None
+
+        return _parse_contacts(result.stdout)
 
     except Exception:
-        return []
+        return None
 
 
-def send_attachment_to_chat(chat_id: str, file_path: str, text: str | None = None) -> dict:
+@_osa_send(
+    timeout=60,
+    ok_fields=lambda chat_id, file_path, text=None: {"chat_id": chat_id, "file": file_path},
+)
+def send_attachment_to_chat(chat_id: str, file_path: str, text: str | None = None) -> tuple[str, list[str]]:
     """Send a file attachment to a group chat.
 
     Args:
@@ -266,41 +665,4 @@ def send_attachment_to_chat(chat_id: str, file_path: str, text: str | None = Non
         Dict with success status
 
     """
-    escaped_chat_id = escape_applescript_string(chat_id)
-    escaped_path = escape_applescript_string(file_path)
-
-    if text:
-        escaped_text = escape_applescript_string(text)
-        script = f'''
-            tell application "Messages"
-                set targetChat to chat id "{escaped_chat_id}"
-                send "{escaped_text}" to targetChat
-                send POSIX file "{escaped_path}" to targetChat
-            end tell
-        '''
-    else:
-        script = f'''
-            tell application "Messages"
-                set targetChat to chat id "{escaped_chat_id}"
-                send POSIX file "{escaped_path}" to targetChat
-            end tell
-        '''
-
-    try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            check=False,
-        )
-
-        if result.returncode != 0:
-            return {"success": False, "error": result.stderr.strip() or "AppleScript error"}
-
-        return {"success": True, "chat_id": chat_id, "file": file_path}
-
-    except subprocess.TimeoutExpired:
-        return {"success": False, "error": "Timeout"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return _SEND_FILE_CHAT_SCRIPT, [chat_id, file_path, text or ""]
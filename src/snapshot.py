@@ -0,0 +1,162 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Indexed snapshot of chat.db.
+
+chat.db is owned by Messages.app and opened read-only, so it can't gain the
+indexes our queries want. Instead a consistent copy is taken with the SQLite
+backup API, indexed, and re-taken in the background after chat.db (or its
+WAL) changes, at most once per min_interval.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+
+
+# Bump when SNAPSHOT_INDEXES changes so existing snapshots are re-taken
+SNAPSHOT_VERSION = 3
+
+# Messages.app writes to chat.db constantly, so re-take the O(db) copy at most this often (seconds)
+SNAPSHOT_MIN_INTERVAL = 60.0
+
+# Indexes added to the snapshot for the query shapes in db.py
+SNAPSHOT_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_message_date ON message(date DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_cmj_msg ON chat_message_join(message_id)",
+    # get_messages(chat_id=...) starts from the chat row before joining inward
+    "CREATE INDEX IF NOT EXISTS ix_chat_identifier ON chat(chat_identifier)",
+    # Matches get_messages(unread_only=True) literally, so the planner can use it
+    "CREATE INDEX IF NOT EXISTS ix_message_unread ON message(date DESC) WHERE is_read = 0 AND is_from_me = 0",
+)
+
+
+class IndexedSnapshot:
+    """Keeps an indexed copy of chat.db up to date with the original."""
+
+    def __init__(self, source_path: str, snapshot_path: str, min_interval: float = SNAPSHOT_MIN_INTERVAL) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            source_path: Path to chat.db
+            snapshot_path: Where to keep the indexed copy
+            min_interval: Minimum seconds between re-takes of the copy
+
+        """
+        self.source_path = source_path
+        self.snapshot_path = snapshot_path
+        self.min_interval = min_interval
+        # Bumped each time a new snapshot file is in place; 0 while there is none
+        self.generation = 0
+        self._snapshot_mtime_ns: int | None = None
+        self._checked_stored = False
+        self._refreshed_at: float | None = None  # Last check or copy that succeeded
+        self._failed_at: float | None = None  # Last one that failed, so retries back off too
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether a snapshot file is in place to read from."""
+        return self.generation > 0
+
+    def _source_mtime_ns(self) -> int:
+        """Latest modification time across chat.db and its WAL."""
+        mtime_ns = os.stat(self.source_path).st_mtime_ns
+        with contextlib.suppress(FileNotFoundError):
+            mtime_ns = max(mtime_ns, os.stat(self.source_path + "-wal").st_mtime_ns)
+        return mtime_ns
+
+    def _stored_mtime_ns(self) -> int | None:
+        """Source mtime recorded in an existing snapshot, so restarts can reuse it."""
+        if not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{self.snapshot_path}?mode=ro", uri=True)
+            try:
+                mtime_ns, version = conn.execute("SELECT source_mtime_ns, version FROM snapshot_info").fetchone()
+                return mtime_ns if version == SNAPSHOT_VERSION else None
+            finally:
+                conn.close()
+        except (sqlite3.Error, TypeError):
+            return None
+
+    def refresh(self) -> None:
+        """Start re-taking the snapshot in a background thread if chat.db changed.
+
+        Never waits for a copy: readers keep the current snapshot (or chat.db
+        itself while there is none) and pick up a new one via ``generation``.
+        Checks run at most once per ``min_interval``, so the snapshot can lag
+        chat.db by that long plus the time a copy takes.
+        """
+        with self._lock:
+            if not self._checked_stored:
+                self._checked_stored = True
+                self._snapshot_mtime_ns = self._stored_mtime_ns()
+                if self._snapshot_mtime_ns is not None:
+                    self.generation += 1
+            if self._worker is not None:
+                return
+            now = time.monotonic()
+            last = max((t for t in (self._refreshed_at, self._failed_at) if t is not None), default=None)
+            if last is not None and now - last < self.min_interval:
+                return
+            try:
+                mtime_ns = self._source_mtime_ns()
+            except OSError:
+                self._failed_at = now
+                return
+            if mtime_ns == self._snapshot_mtime_ns:
+                self._refreshed_at = now
+                return
+            self._worker = threading.Thread(target=self._take, args=[mtime_ns], name="imessage-snapshot", daemon=True)
+            self._worker.start()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for a re-take in progress, if any, to finish."""
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def _take(self, mtime_ns: int) -> None:
+        """Copy chat.db and swap the copy in; runs on the worker thread."""
+        try:
+            self._copy(mtime_ns)
+        except (OSError, sqlite3.Error):
+            with self._lock:
+                self._failed_at = time.monotonic()
+                self._worker = None
+            return
+        with self._lock:
+            self._snapshot_mtime_ns = mtime_ns
+            self._refreshed_at = time.monotonic()
+            self.generation += 1
+            self._worker = None
+
+    def _copy(self, mtime_ns: int) -> None:
+        """Back up chat.db to a temporary file, index it, and move it into place."""
+        os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+        tmp_path = self.snapshot_path + ".tmp"
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+
+        source = sqlite3.connect(f"file:{self.source_path}?mode=ro", uri=True)
+        target = sqlite3.connect(tmp_path)
+        try:
+            source.backup(target)
+            # Rollback journal so the copy can be opened read-only without a -shm file
+            target.execute("PRAGMA journal_mode = DELETE")
+            for statement in SNAPSHOT_INDEXES:
+                target.execute(statement)
+            target.execute("CREATE TABLE snapshot_info (source_mtime_ns INTEGER NOT NULL, version INTEGER NOT NULL)")
+            target.execute("INSERT INTO snapshot_info VALUES (?, ?)", [mtime_ns, SNAPSHOT_VERSION])
+            target.commit()
+        finally:
+            target.close()
+            source.close()
+
+        os.replace(tmp_path, self.snapshot_path)
@@ -9,9 +9,12 @@ Uses chat.db (SQLite) for reading and AppleScript for sending.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from pydantic.dataclasses import dataclass
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypeVar
 
 from dedalus_mcp import tool
 from dedalus_mcp.types import ToolAnnotations
@@ -23,6 +26,7 @@ from sender import (
     send_attachment,
     send_attachment_to_chat,
     send_message,
+    send_message_batch,
     send_to_chat,
 )
 
@@ -34,7 +38,48 @@ if TYPE_CHECKING:
 # --- Database instance ---
 
 _db: IMessageDatabase | None = None
-_watcher_cursor: int | None = None  # Tracks last seen message ID for watching
+_WATCH_BATCH_SIZE = 50  # Messages returned per check_new_messages call
+_WATCH_SESSION_TTL = 3600.0  # Seconds a watcher may go unpolled before it is dropped
+_MAX_WATCH_SESSIONS = 64  # Beyond this, starting a watcher evicts the least recently used one
+
+
+def _env_limit(name: str, default: int) -> int:
+    """Read a positive row limit from the environment, ignoring unusable values."""
+    try:
+        value = int(os.getenv(name) or default)
+    except ValueError:
+        return default
+    # 0 or less would turn every read into an empty result
+    return max(1, value)
+
+
+_MAX_LIMIT = _env_limit("IMESSAGE_MCP_MAX_LIMIT", 500)  # Most rows a single read tool call returns
+
+
+@dataclass(slots=True)
+class _WatchSession:
+    """Watcher state for one session_id."""
+
+    cursor: int  # Last seen message ID
+    data_version: int  # chat.db change counter when this session last queried
+    backlog: bool = False  # Messages past the cursor may remain even if chat.db is unchanged
+    last_used: float = field(default_factory=time.monotonic)
+    # Serializes polls of one session so two can't hand out the same messages
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# Keyed by session_id. The server is stateless HTTP, so clients name their
+# watcher explicitly; only the event loop thread touches this dict.
+_watchers: dict[str, _WatchSession] = {}
+
+
+def _prune_watchers() -> None:
+    """Drop idle watchers, then the least recently used ones while over the cap."""
+    now = time.monotonic()
+    for session_id in [sid for sid, session in _watchers.items() if now - session.last_used > _WATCH_SESSION_TTL]:
+        del _watchers[session_id]
+    while len(_watchers) >= _MAX_WATCH_SESSIONS:
+        del _watchers[min(_watchers, key=lambda sid: _watchers[sid].last_used)]
 
 
 def get_db() -> IMessageDatabase:
@@ -45,10 +90,27 @@ def get_db() -> IMessageDatabase:
     return _db
 
 
+# --- AppleScript calls ---
+
+# osascript round trips take tens to hundreds of ms, so they run in threads
+# to keep the event loop serving other tools. Bounded because Messages.app
+# doesn't cope well with many sends at once.
+_osa_slots = asyncio.Semaphore(4)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+async def _run_osa(fn: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    """Run a blocking sender function off the event loop."""
+    async with _osa_slots:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
 # --- Result Types ---
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessagesResult:
     """Result from reading messages."""
 
@@ -57,7 +119,7 @@ class MessagesResult:
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatsResult:
     """Result from listing chats."""
 
@@ -66,7 +128,7 @@ class ChatsResult:
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SendResult:
     """Result from sending a message."""
 
@@ -76,7 +138,16 @@ class SendResult:
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class BatchSendResult:
+    """Result from sending one message to several recipients."""
+
+    sent: int
+    results: list[SendResult]
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class StatusResult:
     """iMessage status check result."""
 
@@ -89,11 +160,25 @@ class StatusResult:
 
 # --- Tools ---
 
+# Shared by every tool with the same hints, so each is built once
+_ANN_RO_IDEMPOTENT = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+_ANN_RO = ToolAnnotations(readOnlyHint=True)
+_ANN_WRITE = ToolAnnotations(readOnlyHint=False)
+
+
+async def _probe_db() -> str | None:
+    """Check that chat.db can be read, returning the error if it can't."""
+    try:
+        await asyncio.to_thread(get_db().check_access)
+    except Exception as e:
+        return str(e)
+    return None
+
 
 @tool(
     description="Check iMessage status - whether Messages.app is running and database is accessible",
     tags=["imessage", "status", "health"],
-    annotations=ToolAnnotations(readOnlyHint=True, idempotentHint=True),
+    annotations=_ANN_RO_IDEMPOTENT,
 )
 async def check_status() -> StatusResult:
     """Check if iMessage is ready to use.
@@ -104,16 +189,9 @@ async def check_status() -> StatusResult:
     """
     import platform as plat
 
-    status = check_messages_app()
-
-    try:
-        db = get_db()
-        db._get_connection()
-        db_accessible = True
-        db_error = None
-    except Exception as e:
-        db_accessible = False
-        db_error = str(e)
+    # Independent checks, so the database probe runs during the osascript round trip
+    status, db_error = await asyncio.gather(_run_osa(check_messages_app), _probe_db())
+    db_accessible = db_error is None
 
     return StatusResult(
         platform=plat.system(),
@@ -127,7 +205,7 @@ async def check_status() -> StatusResult:
 @tool(
     description="Read iMessage/SMS messages with optional filters. Use chronological=true for conversation threads.",
     tags=["imessage", "read", "messages"],
-    annotations=ToolAnnotations(readOnlyHint=True),
+    annotations=_ANN_RO,
 )
 async def read_messages(
     limit: int = 50,
@@ -139,7 +217,7 @@ async def read_messages(
     """Read messages from iMessage database.
 
     Args:
-        limit: Maximum number of messages to return (default 50)
+        limit: Maximum number of messages to return (default 50, capped by IMESSAGE_MCP_MAX_LIMIT)
         chat_id: Filter by specific chat identifier (phone/email or group chat ID)
         since: ISO date string to filter messages after (e.g., "2024-01-15T00:00:00")
         search: Text to search for in message content
@@ -149,9 +227,13 @@ async def read_messages(
         MessagesResult with messages array and count
 
     """
+    if limit <= 0:
+        return MessagesResult(count=0, messages=[])
+    limit = min(limit, _MAX_LIMIT)
     try:
         db = get_db()
-        messages = db.get_messages(
+        messages = await asyncio.to_thread(
+            db.get_messages,
             limit=limit,
             chat_id=chat_id,
             since=since,
@@ -166,21 +248,24 @@ async def read_messages(
 @tool(
     description="List all iMessage conversations/chats with metadata like message count and last activity",
     tags=["imessage", "read", "chats"],
-    annotations=ToolAnnotations(readOnlyHint=True),
+    annotations=_ANN_RO,
 )
 async def list_chats(limit: int = 50) -> ChatsResult:
     """List all conversations.
 
     Args:
-        limit: Maximum number of chats to return (default 50)
+        limit: Maximum number of chats to return (default 50, capped by IMESSAGE_MCP_MAX_LIMIT)
 
     Returns:
         ChatsResult with chats array and count
 
     """
+    if limit <= 0:
+        return ChatsResult(count=0, chats=[])
+    limit = min(limit, _MAX_LIMIT)
     try:
         db = get_db()
-        chats = db.list_chats(limit=limit)
+        chats = await asyncio.to_thread(db.list_chats, limit=limit)
         return ChatsResult(count=len(chats), chats=chats)
     except Exception as e:
         return ChatsResult(count=0, chats=[], error=str(e))
@@ -189,7 +274,7 @@ async def list_chats(limit: int = 50) -> ChatsResult:
 @tool(
     description="Get participants of a specific chat/conversation by chat identifier",
     tags=["imessage", "read", "chats"],
-    annotations=ToolAnnotations(readOnlyHint=True),
+    annotations=_ANN_RO,
 )
 async def get_chat_participants(chat_id: str) -> dict:
     """Get participants of a chat.
@@ -203,7 +288,7 @@ async def get_chat_participants(chat_id: str) -> dict:
     """
     try:
         db = get_db()
-        participants = db.get_chat_participants(chat_id)
+        participants = await asyncio.to_thread(db.get_chat_participants, chat_id)
         return {"chat_id": chat_id, "participants": participants}
     except Exception as e:
         return {"chat_id": chat_id, "participants": [], "error": str(e)}
@@ -212,7 +297,7 @@ async def get_chat_participants(chat_id: str) -> dict:
 @tool(
     description="Send an iMessage to a phone number (with country code like +14155551234) or email address",
     tags=["imessage", "send"],
-    annotations=ToolAnnotations(readOnlyHint=False),
+    annotations=_ANN_WRITE,
 )
 async def send_imessage(recipient: str, text: str) -> SendResult:
     """Send an iMessage.
@@ -225,15 +310,7 @@ async def send_imessage(recipient: str, text: str) -> SendResult:
         SendResult with success status
 
     """
-    status = check_messages_app()
-    if not status["messages_running"]:
-        return SendResult(
-            success=False,
-            recipient=recipient,
-            error="Messages.app is not running. Please open it first.",
-        )
-
-    result = send_message(recipient, text)
+    result = await _run_osa(send_message, recipient, text)
 
     return SendResult(
         success=result["success"],
@@ -242,10 +319,41 @@ async def send_imessage(recipient: str, text: str) -> SendResult:
     )
 
 
+@tool(
+    description="Send the same iMessage, optionally with a file, to several phone numbers or email addresses at once",
+    tags=["imessage", "send", "batch"],
+    annotations=_ANN_WRITE,
+)
+async def send_imessage_batch(recipients: list[str], text: str = "", file_path: str | None = None) -> BatchSendResult:
+    """Send one message to several recipients in a single Messages.app run.
+
+    Args:
+        recipients: Phone numbers or email addresses
+        text: Message text to send, may be empty when sending a file
+        file_path: Optional absolute path to a file to send after the text
+
+    Returns:
+        BatchSendResult with one SendResult per recipient
+
+    """
+    if not text and not file_path:
+        return BatchSendResult(sent=0, results=[], error="Nothing to send: provide text, file_path, or both")
+
+    results = await _run_osa(send_message_batch, recipients, text, file_path)
+
+    return BatchSendResult(
+        sent=sum(result["success"] for result in results),
+        results=[
+            SendResult(success=result["success"], recipient=result["recipient"], error=result.get("error"))
+            for result in results
+        ],
+    )
+
+
 @tool(
     description="Send an iMessage to a group chat using the chat ID (get chat IDs from list_chats)",
     tags=["imessage", "send", "group"],
-    annotations=ToolAnnotations(readOnlyHint=False),
+    annotations=_ANN_WRITE,
 )
 async def send_to_group(chat_id: str, text: str) -> SendResult:
     """Send a message to a group chat.
@@ -258,15 +366,7 @@ async def send_to_group(chat_id: str, text: str) -> SendResult:
         SendResult with success status
 
     """
-    status = check_messages_app()
-    if not status["messages_running"]:
-        return SendResult(
-            success=False,
-            chat_id=chat_id,
-            error="Messages.app is not running. Please open it first.",
-        )
-
-    result = send_to_chat(chat_id, text)
+    result = await _run_osa(send_to_chat, chat_id, text)
 
     return SendResult(
         success=result["success"],
@@ -278,27 +378,30 @@ async def send_to_group(chat_id: str, text: str) -> SendResult:
 @tool(
     description="Get unread messages from all conversations",
     tags=["imessage", "read", "unread"],
-    annotations=ToolAnnotations(readOnlyHint=True),
+    annotations=_ANN_RO,
 )
 async def get_unread_messages(limit: int = 50) -> MessagesResult:
     """Get unread messages.
 
     Args:
-        limit: Maximum number of messages (default 50)
+        limit: Maximum number of messages (default 50, capped by IMESSAGE_MCP_MAX_LIMIT)
 
     Returns:
         MessagesResult with unread messages
 
     """
+    if limit <= 0:
+        return MessagesResult(count=0, messages=[])
+    limit = min(limit, _MAX_LIMIT)
     try:
         db = get_db()
-        messages = db.get_messages(limit=limit, unread_only=True)
+        messages = await asyncio.to_thread(db.get_messages, limit=limit, unread_only=True)
         return MessagesResult(count=len(messages), messages=messages)
     except Exception as e:
         return MessagesResult(count=0, messages=[], error=str(e))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttachmentResult:
     """Result from getting attachments."""
 
@@ -311,7 +414,7 @@ class AttachmentResult:
 @tool(
     description="Get attachments for a specific message by message ID",
     tags=["imessage", "read", "attachments"],
-    annotations=ToolAnnotations(readOnlyHint=True),
+    annotations=_ANN_RO,
 )
 async def get_attachments(message_id: int) -> AttachmentResult:
     """Get attachments for a message.
@@ -325,13 +428,45 @@ async def get_attachments(message_id: int) -> AttachmentResult:
     """
     try:
         db = get_db()
-        attachments = db.get_attachments(message_id)
+        attachments = await asyncio.to_thread(db.get_attachments, message_id)
         return AttachmentResult(message_id=message_id, count=len(attachments), attachments=attachments)
     except Exception as e:
         return AttachmentResult(message_id=message_id, count=0, attachments=[], error=str(e))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class BulkAttachmentResult:
+    """Result from getting attachments for several messages."""
+
+    count: int
+    attachments: dict[int, list[dict]]
+    error: str | None = None
+
+
+@tool(
+    description="Get attachments for several messages at once by message ID",
+    tags=["imessage", "read", "attachments"],
+    annotations=_ANN_RO,
+)
+async def get_attachments_bulk(message_ids: list[int]) -> BulkAttachmentResult:
+    """Get attachments for many messages in one lookup.
+
+    Args:
+        message_ids: Message IDs (from read_messages)
+
+    Returns:
+        BulkAttachmentResult mapping each message ID with attachments to its attachment info
+
+    """
+    try:
+        db = get_db()
+        attachments = await asyncio.to_thread(db.get_attachments_for_messages, message_ids)
+        return BulkAttachmentResult(count=sum(len(a) for a in attachments.values()), attachments=attachments)
+    except Exception as e:
+        return BulkAttachmentResult(count=0, attachments={}, error=str(e))
+
+
+@dataclass(frozen=True, slots=True)
 class DownloadResult:
     """Result from downloading an attachment."""
 
@@ -346,7 +481,7 @@ class DownloadResult:
 @tool(
     description="Download an attachment to a local path. HEIC images are auto-converted to JPEG.",
     tags=["imessage", "read", "attachments"],
-    annotations=ToolAnnotations(readOnlyHint=False),
+    annotations=_ANN_WRITE,
 )
 async def download_attachment(source_path: str, dest_path: str) -> DownloadResult:
     """Download an attachment to a local path.
@@ -362,7 +497,7 @@ async def download_attachment(source_path: str, dest_path: str) -> DownloadResul
 
     """
     try:
-        result = db_download_attachment(source_path, dest_path)
+        result = await asyncio.to_thread(db_download_attachment, source_path, dest_path)
         if result["success"]:
             return DownloadResult(
                 success=True,
@@ -379,7 +514,7 @@ async def download_attachment(source_path: str, dest_path: str) -> DownloadResul
 @tool(
     description="Send a file attachment via iMessage to a phone number or email",
     tags=["imessage", "send", "attachment"],
-    annotations=ToolAnnotations(readOnlyHint=False),
+    annotations=_ANN_WRITE,
 )
 async def send_file(recipient: str, file_path: str, text: str | None = None) -> SendResult:
     """Send a file attachment.
@@ -393,11 +528,7 @@ async def send_file(recipient: str, file_path: str, text: str | None = None) ->
         SendResult with success status
 
     """
-    status = check_messages_app()
-    if not status["messages_running"]:
-        return SendResult(success=False, recipient=recipient, error="Messages.app is not running")
-
-    result = send_attachment(recipient, file_path, text)
+    result = await _run_osa(send_attachment, recipient, file_path, text)
 
     return SendResult(
         success=result["success"],
@@ -409,7 +540,7 @@ async def send_file(recipient: str, file_path: str, text: str | None = None) ->
 @tool(
     description="Send a file attachment to a group chat",
     tags=["imessage", "send", "attachment", "group"],
-    annotations=ToolAnnotations(readOnlyHint=False),
+    annotations=_ANN_WRITE,
 )
 async def send_file_to_group(chat_id: str, file_path: str, text: str | None = None) -> SendResult:
     """Send a file attachment to a group chat.
@@ -423,11 +554,7 @@ async def send_file_to_group(chat_id: str, file_path: str, text: str | None = No
         SendResult with success status
 
     """
-    status = check_messages_app()
-    if not status["messages_running"]:
-        return SendResult(success=False, chat_id=chat_id, error="Messages.app is not running")
-
-    result = send_attachment_to_chat(chat_id, file_path, text)
+    result = await _run_osa(send_attachment_to_chat, chat_id, file_path, text)
 
     return SendResult(
         success=result["success"],
@@ -436,102 +563,148 @@ async def send_file_to_group(chat_id: str, file_path: str, text: str | None = No
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WatcherResult:
     """Result from watcher operations."""
 
     watching: bool
     cursor: int | None
+    recent: list[dict] = field(default_factory=list)
     message: str | None = None
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewMessagesResult:
     """Result from checking new messages."""
 
     count: int
     messages: list[dict]
     cursor: int | None
+    has_more: bool = False
     error: str | None = None
 
 
 @tool(
     description="Start watching for new messages. Call check_new_messages periodically to get updates.",
     tags=["imessage", "watch"],
-    annotations=ToolAnnotations(readOnlyHint=False),
+    annotations=_ANN_WRITE,
 )
-async def start_watching() -> WatcherResult:
+async def start_watching(include_recent: int = 0, session_id: str = "default") -> WatcherResult:
     """Start watching for new messages.
 
     Sets a cursor at the current latest message. Subsequent calls to
     check_new_messages will return messages received after this point.
+    Restarting an existing session moves its cursor. A session not polled
+    for an hour is dropped, as is the least recently used one once 64 exist.
+
+    Args:
+        include_recent: Also return this many of the latest messages, read
+            in the same query that sets the cursor (default: 0)
+        session_id: Names this watcher, so concurrent clients each keep
+            their own cursor (default: "default")
 
     Returns:
-        WatcherResult with watching status
+        WatcherResult with watching status and any recent messages
 
     """
-    global _watcher_cursor
     try:
         db = get_db()
-        _watcher_cursor = db.get_latest_message_id()
-        return WatcherResult(watching=True, cursor=_watcher_cursor, message="Watching started")
+        # Take the change marker first so anything committed after it is picked up
+        data_version = await asyncio.to_thread(db.data_version)
+        recent: list[dict] = []
+        if include_recent > 0:
+            recent = await asyncio.to_thread(db.get_recent_messages, min(include_recent, _MAX_LIMIT))
+            cursor = recent[-1]["id"] if recent else 0
+        else:
+            cursor = await asyncio.to_thread(db.get_latest_message_id)
+        _watchers.pop(session_id, None)
+        _prune_watchers()
+        _watchers[session_id] = _WatchSession(cursor=cursor, data_version=data_version)
+        return WatcherResult(watching=True, cursor=cursor, recent=recent, message="Watching started")
     except Exception as e:
         return WatcherResult(watching=False, cursor=None, error=str(e))
 
 
 @tool(
-    description="Check for new messages since watching started. Returns new messages and updates cursor.",
+    description=(
+        "Check for new messages since watching started. Returns new messages and updates cursor; "
+        "call again while has_more is true."
+    ),
     tags=["imessage", "watch", "read"],
-    annotations=ToolAnnotations(readOnlyHint=True),
+    annotations=_ANN_RO,
 )
-async def check_new_messages() -> NewMessagesResult:
+async def check_new_messages(session_id: str = "default") -> NewMessagesResult:
     """Check for new messages since last check.
 
     Returns messages received since start_watching was called (or since
-    the last check_new_messages call). Updates the cursor automatically.
+    the last check_new_messages call). Updates the cursor automatically;
+    has_more means another call will return more messages right away.
+
+    Args:
+        session_id: Watcher passed to start_watching (default: "default")
 
     Returns:
         NewMessagesResult with new messages
 
     """
-    global _watcher_cursor
-    if _watcher_cursor is None:
+    session = _watchers.get(session_id)
+    if session is not None and time.monotonic() - session.last_used > _WATCH_SESSION_TTL:
+        del _watchers[session_id]
+        session = None
+    if session is None:
         return NewMessagesResult(count=0, messages=[], cursor=None, error="Not watching. Call start_watching first.")
-
-    try:
-        db = get_db()
-        messages = db.get_messages_since_id(_watcher_cursor)
-
-        # Update cursor to latest message
-        if messages:
-            _watcher_cursor = max(m["id"] for m in messages)
-
-        return NewMessagesResult(count=len(messages), messages=messages, cursor=_watcher_cursor)
-    except Exception as e:
-        return NewMessagesResult(count=0, messages=[], cursor=_watcher_cursor, error=str(e))
+    session.last_used = time.monotonic()
+
+    async with session.lock:
+        try:
+            db = get_db()
+            # Off the loop: the first read opens the watch connection, and any read can wait on a busy lock
+            data_version = await asyncio.to_thread(db.data_version)
+            if not session.backlog and data_version == session.data_version:
+                return NewMessagesResult(count=0, messages=[], cursor=session.cursor)
+
+            # Until this poll succeeds, the next one must query even if nothing changed
+            session.data_version = data_version
+            session.backlog = True
+            messages = await asyncio.to_thread(db.get_messages_since_id, session.cursor, limit=_WATCH_BATCH_SIZE)
+            session.backlog = len(messages) == _WATCH_BATCH_SIZE
+
+            # Rows come back in id order, so the last one is the new cursor
+            if messages:
+                session.cursor = messages[-1]["id"]
+                # Index new messages now so the next search doesn't have to
+                await asyncio.to_thread(db.sync_search_index)
+
+            return NewMessagesResult(
+                count=len(messages), messages=messages, cursor=session.cursor, has_more=session.backlog
+            )
+        except Exception as e:
+            return NewMessagesResult(count=0, messages=[], cursor=session.cursor, error=str(e))
 
 
 @tool(
     description="Stop watching for new messages",
     tags=["imessage", "watch"],
-    annotations=ToolAnnotations(readOnlyHint=False),
+    annotations=_ANN_WRITE,
 )
-async def stop_watching() -> WatcherResult:
+async def stop_watching(session_id: str = "default") -> WatcherResult:
     """Stop watching for new messages.
 
-    Clears the cursor. Call start_watching to begin again.
+    Clears the session's cursor. Call start_watching to begin again.
+
+    Args:
+        session_id: Watcher passed to start_watching (default: "default")
 
     Returns:
         WatcherResult confirming stopped
 
     """
-    global _watcher_cursor
-    _watcher_cursor = None
+    _watchers.pop(session_id, None)
     return WatcherResult(watching=False, cursor=None, message="Watching stopped")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContactsResult:
     """Result from contact lookup."""
 
@@ -544,7 +717,7 @@ class ContactsResult:
 @tool(
     description="Search macOS Contacts by name to find phone numbers and emails",
     tags=["contacts", "lookup"],
-    annotations=ToolAnnotations(readOnlyHint=True),
+    annotations=_ANN_RO,
 )
 async def lookup_contact(name: str) -> ContactsResult:
     """Look up a contact by name.
@@ -557,22 +730,24 @@ async def lookup_contact(name: str) -> ContactsResult:
 
     """
     try:
-        contacts = search_contacts(name)
+        contacts = await _run_osa(search_contacts, name)
         return ContactsResult(query=name, count=len(contacts), contacts=contacts)
     except Exception as e:
         return ContactsResult(query=name, count=0, contacts=[], error=str(e))
 
 
 # Export all tools
-imessage_tools = [
+imessage_tools: Final[tuple[Callable[..., Any], ...]] = (
     check_status,
     read_messages,
     list_chats,
     get_chat_participants,
     get_unread_messages,
     get_attachments,
+    get_attachments_bulk,
     download_attachment,
     send_imessage,
+    send_imessage_batch,
     send_to_group,
     send_file,
     send_file_to_group,
@@ -580,4 +755,4 @@ imessage_tools = [
     start_watching,
     check_new_messages,
     stop_watching,
-]
+)
@@ -0,0 +1,87 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Shared fixtures: a synthetic chat.db with the tables db.py reads."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from db import IMessageDatabase
+
+
+CHAT_DB_SCHEMA = """
+    PRAGMA journal_mode = WAL;
+    CREATE TABLE handle (ROWID INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT, service TEXT);
+    CREATE TABLE chat (
+        ROWID INTEGER PRIMARY KEY AUTOINCREMENT, guid TEXT, chat_identifier TEXT,
+        display_name TEXT, group_id TEXT, service_name TEXT
+    );
+    CREATE TABLE message (
+        ROWID INTEGER PRIMARY KEY AUTOINCREMENT, guid TEXT, text TEXT, handle_id INTEGER, date INTEGER,
+        is_from_me INTEGER DEFAULT 0, is_read INTEGER DEFAULT 0, is_sent INTEGER DEFAULT 0,
+        is_delivered INTEGER DEFAULT 0, cache_has_attachments INTEGER DEFAULT 0,
+        associated_message_guid TEXT, associated_message_type INTEGER DEFAULT 0,
+        date_edited INTEGER DEFAULT 0, date_retracted INTEGER DEFAULT 0
+    );
+    CREATE TABLE chat_message_join (chat_id INTEGER, message_id INTEGER, PRIMARY KEY (chat_id, message_id));
+    CREATE TABLE chat_handle_join (chat_id INTEGER, handle_id INTEGER);
+    CREATE TABLE attachment (
+        ROWID INTEGER PRIMARY KEY AUTOINCREMENT, guid TEXT, filename TEXT, mime_type TEXT,
+        transfer_name TEXT, total_bytes INTEGER
+    );
+    CREATE TABLE message_attachment_join (message_id INTEGER, attachment_id INTEGER);
+    INSERT INTO handle (id, service) VALUES ('+15551234567', 'iMessage');
+    INSERT INTO chat (guid, chat_identifier, display_name, group_id, service_name)
+        VALUES ('iMessage;-;+15551234567', '+15551234567', '', NULL, 'iMessage');
+"""
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep sidecar files out of the real ~/Library/Caches."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.delenv("IMESSAGE_MCP_INDEXED_SNAPSHOT", raising=False)
+
+
+@pytest.fixture
+def chat_db_path(tmp_path: Path) -> Path:
+    """Create an empty synthetic chat.db."""
+    path = tmp_path / "chat.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(CHAT_DB_SCHEMA)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def add_message(chat_db_path: Path) -> Callable[..., int]:
+    """Insert a message into the synthetic chat.db, returning its rowid."""
+
+    def add(text: str | None, *, date: int | None = None) -> int:
+        conn = sqlite3.connect(chat_db_path)
+        try:
+            cursor = conn.execute(
+                "INSERT INTO message (guid, text, handle_id, date) "
+                "VALUES (lower(hex(randomblob(8))), ?, 1, COALESCE(?, (SELECT COUNT(*) FROM message) * 1000000000))",
+                [text, date],
+            )
+            conn.execute("INSERT INTO chat_message_join VALUES (1, ?)", [cursor.lastrowid])
+            conn.commit()
+            return cursor.lastrowid
+        finally:
+            conn.close()
+
+    return add
+
+
+@pytest.fixture
+def db(chat_db_path: Path, tmp_path: Path) -> Iterator[IMessageDatabase]:
+    """An IMessageDatabase over the synthetic chat.db."""
+    database = IMessageDatabase(str(chat_db_path), search_index_path=str(tmp_path / "search.db"))
+    yield database
+    database.close()
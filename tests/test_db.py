@@ -0,0 +1,47 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Tests for the chat.db connection pool."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import db as db_module
+from db import IMessageDatabase
+
+
+def test_reads_inside_iteration_with_single_slot_pool(
+    chat_db_path: Path, tmp_path: Path, add_message: Callable[..., int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A read made while a streaming generator holds the only pooled connection doesn't wait on it."""
+    monkeypatch.setattr(db_module.os, "cpu_count", lambda: 1)
+    for i in range(5):
+        add_message(f"message {i}")
+    database = IMessageDatabase(str(chat_db_path), search_index_path=str(tmp_path / "search.db"))
+    try:
+        newest_first = []
+        for message in database.iter_messages(limit=10):
+            assert database.get_attachments(message["id"]) == []
+            newest_first.append(message["id"])
+        assert newest_first == [5, 4, 3, 2, 1]
+
+        since = []
+        for message in database.iter_messages_since_id(3):
+            assert database.get_latest_message_id() == 5
+            since.append(message["id"])
+        assert since == [4, 5]
+    finally:
+        database.close()
+
+
+def test_json_timestamps_are_utc(db: IMessageDatabase, add_message: Callable[..., int]) -> None:
+    """timestamp_ns counts from 2001-01-01 UTC whatever the local timezone."""
+    add_message("at the epoch", date=0)
+    add_message("a second later", date=1_000_000_000)
+    messages = json.loads(db.get_messages_json(chronological=True))
+    assert [m["timestamp_ns"] for m in messages] == [978_307_200 * 10**9, 978_307_201 * 10**9]
@@ -0,0 +1,132 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Tests for the FTS5 search sidecar."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import search_index
+from conftest import CHAT_DB_SCHEMA
+from db import IMessageDatabase, get_sidecar_path
+from search_index import to_fts_query
+
+
+@pytest.mark.parametrize(
+    ("search", "expected"),
+    [
+        ("hello", '"hello"'),
+        ("hello there", '"hello there"'),
+        ('say "hi"', '"say ""hi"""'),
+        ("a OR b", '"a OR b"'),
+        ("hi", ""),
+        ("😂", ""),
+        ("", ""),
+    ],
+)
+def test_to_fts_query(search: str, expected: str) -> None:
+    """Searches become one quoted phrase; ones shorter than a trigram are left to LIKE."""
+    assert to_fts_query(search) == expected
+
+
+@pytest.mark.parametrize(
+    ("search", "expected_text"),
+    [
+        ("ello", "hello there"),
+        ("HELLO", "hello there"),
+        ("lo th", "hello there"),
+        ("日本語", "今日は日本語を勉強します"),
+        ("😂", "lol 😂"),
+        ("?", "really?"),
+        (" - ", "a - b"),
+        ("foo-bar", "foo-bar baz"),
+    ],
+)
+def test_search_matches_substrings(
+    db: IMessageDatabase, add_message: Callable[..., int], search: str, expected_text: str
+) -> None:
+    """FTS and LIKE searches both find any substring, as LIKE always did."""
+    for text in ("hello there", "今日は日本語を勉強します", "lol 😂", "really?", "a - b", "foo-bar baz", None):
+        add_message(text)
+    assert [m["text"] for m in db.get_messages(search=search)] == [expected_text]
+
+
+def test_sidecar_built_from_another_chat_db_is_rebuilt(
+    tmp_path: Path, chat_db_path: Path, add_message: Callable[..., int]
+) -> None:
+    """An index left by a different chat.db is never trusted, even if it has more rowids."""
+    other_path = tmp_path / "other.db"
+    conn = sqlite3.connect(other_path)
+    conn.executescript(CHAT_DB_SCHEMA)
+    conn.executemany(
+        "INSERT INTO message (guid, text, date) VALUES (?, ?, 0)", [("a", "foo-bar"), ("b", "x"), ("c", "y")]
+    )
+    conn.commit()
+    conn.close()
+    index_path = str(tmp_path / "shared-search.db")
+    other = IMessageDatabase(str(other_path), search_index_path=index_path)
+    assert len(other.get_messages(search="foo-bar")) == 1
+    other.close()
+
+    add_message(None)
+    add_message("someone reacted")
+    database = IMessageDatabase(str(chat_db_path), search_index_path=index_path)
+    try:
+        assert database.get_messages(search="foo-bar") == []
+        assert [m["text"] for m in database.get_messages(search="reacted")] == ["someone reacted"]
+    finally:
+        database.close()
+
+
+def test_sync_rebuilds_when_rowids_go_backwards(
+    db: IMessageDatabase, chat_db_path: Path, add_message: Callable[..., int]
+) -> None:
+    """Once rowids go backwards, indexed rowids may be reused by other messages."""
+    for text in ("first message", "second message", "third message"):
+        add_message(text)
+    assert len(db.get_messages(search="message")) == 3
+    conn = sqlite3.connect(chat_db_path)
+    conn.execute("DELETE FROM message WHERE rowid > 1")
+    conn.execute("DELETE FROM chat_message_join WHERE message_id > 1")
+    conn.execute("UPDATE sqlite_sequence SET seq = 1 WHERE name = 'message'")
+    conn.commit()
+    conn.close()
+    assert len(db.get_messages(search="message")) == 1
+
+    assert add_message("replacement text") == 2
+    assert db.get_messages(search="second") == []
+    assert [m["id"] for m in db.get_messages(search="replacement")] == [2]
+
+
+def test_sync_reindexes_edited_and_unsent_messages(
+    db: IMessageDatabase, chat_db_path: Path, add_message: Callable[..., int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Edits replace the indexed text and unsent messages drop out of search."""
+    monkeypatch.setattr(search_index, "_EDIT_SCAN_INTERVAL", 0)
+    edited = add_message("see you at noon")
+    add_message("unsent by mistake")
+    add_message("filler")
+    assert len(db.get_messages(search="noon")) == 1
+    conn = sqlite3.connect(chat_db_path)
+    conn.execute("UPDATE message SET text = 'see you at five', date_edited = 10 WHERE rowid = ?", [edited])
+    conn.execute("UPDATE message SET text = NULL, date_retracted = 20 WHERE text = 'unsent by mistake'")
+    conn.commit()
+    conn.close()
+    assert db.get_messages(search="noon") == []
+    assert [m["id"] for m in db.get_messages(search="five")] == [edited]
+    assert db.get_messages(search="mistake") == []
+
+
+def test_default_sidecar_path_is_per_chat_db(tmp_path: Path) -> None:
+    """Different chat.db files get different default sidecars."""
+    first = get_sidecar_path(str(tmp_path / "a" / "chat.db"), "search.db")
+    second = get_sidecar_path(str(tmp_path / "b" / "chat.db"), "search.db")
+    assert first != second
+    assert os.path.basename(first).startswith("search-")
+    assert first.endswith(".db")
@@ -0,0 +1,68 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Tests for the indexed chat.db snapshot."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import snapshot as snapshot_module
+from db import IMessageDatabase
+
+
+def test_reads_do_not_wait_for_the_copy(
+    chat_db_path: Path, tmp_path: Path, add_message: Callable[..., int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reads use chat.db until the first copy is in place, then switch to it."""
+    add_message("before the snapshot")
+    release = threading.Event()
+    copy = snapshot_module.IndexedSnapshot._copy
+
+    def slow_copy(self: snapshot_module.IndexedSnapshot, mtime_ns: int) -> None:
+        assert release.wait(10)
+        copy(self, mtime_ns)
+
+    monkeypatch.setattr(snapshot_module.IndexedSnapshot, "_copy", slow_copy)
+    database = IMessageDatabase(str(chat_db_path), search_index_path=str(tmp_path / "search.db"), indexed_snapshot=True)
+    try:
+        assert [m["text"] for m in database.get_messages()] == ["before the snapshot"]
+        assert not database._snapshot.ready
+
+        release.set()
+        database._snapshot.wait()
+        assert database._snapshot.ready
+        assert os.path.exists(database._snapshot.snapshot_path)
+        assert [m["text"] for m in database.get_messages()] == ["before the snapshot"]
+    finally:
+        release.set()
+        database.close()
+
+
+def test_failed_copy_falls_back_to_chat_db(
+    chat_db_path: Path, tmp_path: Path, add_message: Callable[..., int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A copy that fails leaves reads on chat.db and is retried after min_interval, not on every read."""
+    add_message("still readable")
+    attempts = []
+
+    def failing_copy(self: snapshot_module.IndexedSnapshot, mtime_ns: int) -> None:
+        attempts.append(mtime_ns)
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(snapshot_module.IndexedSnapshot, "_copy", failing_copy)
+    database = IMessageDatabase(str(chat_db_path), search_index_path=str(tmp_path / "search.db"), indexed_snapshot=True)
+    try:
+        for _ in range(3):
+            assert [m["text"] for m in database.get_messages()] == ["still readable"]
+            database._snapshot.wait()
+        assert len(attempts) == 1
+        assert not database._snapshot.ready
+    finally:
+        database.close()